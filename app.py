@@ -5,23 +5,38 @@ Enhanced with: task tracking, node monitoring, real-time dashboard
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import contextlib
 import csv
+import gzip
+import hashlib
+import heapq
+import html
+import itertools
+import json
 import logging
 import os
+import queue
 import random
 import threading
 import time
-from dataclasses import dataclass, asdict
+import zlib
+from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from enum import Enum
-from collections import deque, defaultdict
-
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import HTMLResponse, JSONResponse
-from pydantic import BaseModel, Field
+from logging.handlers import QueueHandler, QueueListener
+from collections import Counter, deque, defaultdict
+
+import numpy as np
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 import requests
+from requests.adapters import HTTPAdapter
 
 # -----------------------------
 # Configuration
@@ -29,6 +44,8 @@ import requests
 DATA_FILE = Path(__file__).with_name("sample_runway_data.csv")
 WINDOW_MINUTES = 60
 CYCLE_SECONDS = 45
+MIN_CYCLE_SECONDS = 15  # Soonest new data plus an idle node can pull the next cycle forward
+TIMEOUT_CHECK_SECONDS = 5  # Dead-node / stale-task sweep, independent of the cycle
 TASKS_PER_CYCLE = 5
 AIRPORT_CODE = "VABB"
 AIRPORT_IATA = "BOM"
@@ -37,9 +54,18 @@ AVIATIONSTACK_ACCESS_KEY = os.getenv("AVIATIONSTACK_ACCESS_KEY")
 AVIATIONSTACK_BASE_URL = "https://api.aviationstack.com/v1/flights"
 AVIATIONSTACK_MIN_FETCH_SECONDS = 300
 DEFAULT_OCCUPANCY_SECONDS = 75
+CSV_WRITE_BUFFER_BYTES = 1 << 20  # Flush generated CSV in large chunks
 NODE_TIMEOUT_SECONDS = 30  # Consider node dead if no heartbeat for 30s
 TASK_TIMEOUT_SECONDS = 60  # Task considered stale if not completed in 60s
 WORKING_GRACE_SECONDS = 5  # Keep node in WORKING briefly after activity
+MAX_TASK_WAIT_SECONDS = 25  # Longest /task long-poll; stays under NODE_TIMEOUT_SECONDS
+TASK_WAIT_POLL_SECONDS = 0.25  # How often a held /task request rechecks the queues
+HELD_POLL_HEARTBEAT_SECONDS = 5  # A held /task request refreshes its node's heartbeat this often
+STATUS_CACHE_SECONDS = 0.5  # Reuse a built /status this long if nothing changed
+STATUS_STREAM_POLL_SECONDS = 1.0  # How often /status/stream checks for state changes
+STATUS_STREAM_REFRESH_SECONDS = 5.0  # Push anyway so time-based fields stay current
+MAX_TASKS = int(os.getenv("MAX_TASKS", "1000"))  # Oldest finished tasks are evicted beyond this
+MAX_INFLATED_BODY_BYTES = 4 << 20  # Largest gzip request body we'll decompress
 
 OPENSKY_USERNAME = os.getenv("OPENSKY_USERNAME")
 OPENSKY_PASSWORD = os.getenv("OPENSKY_PASSWORD")
@@ -89,14 +115,16 @@ AIRPORTS = [
 # Logging
 # -----------------------------
 LOG_FILE = Path(__file__).with_name("edge_feedback.log")
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(),
-    ],
-)
+# Request threads only enqueue records; the listener thread does the file and
+# console I/O. It is started/stopped with the app.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+_log_handlers: List[logging.Handler] = [logging.FileHandler(LOG_FILE), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+log_listener = QueueListener(_log_queue, *_log_handlers)
+# The listener's handlers apply the real format; the queue side passes the message through.
+logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[QueueHandler(_log_queue)])
 logger = logging.getLogger("vabb-node")
 
 # -----------------------------
@@ -111,7 +139,7 @@ class TaskStatus(str, Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     task_id: str
     type: str
@@ -123,18 +151,31 @@ class Task:
     window_minutes: int
     result: Optional[Dict[str, Any]] = None
     task_data: Optional[Dict[str, Any]] = None
+    payload_sha: Optional[str] = None  # key of the encoded task_data, served at /payload/<sha>
+    assigned_at_mono: Optional[float] = None  # time.monotonic() twin of assigned_at
+    # /status view of this task; cleared on every status transition.
+    summary_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeInfo:
     node_id: str
-    last_heartbeat: datetime
+    # Heartbeats are bookkept on the monotonic clock only; the wall-clock time
+    # is derived when rendering /status.
+    last_heartbeat_mono: float
     last_active_at: datetime
+    last_active_mono: float
     status: str  # "alive", "dead", "idle", "working"
     tasks_assigned: int
     tasks_completed: int
     tasks_failed: int
     current_task: Optional[str]
+    # Guards this node's mutable fields so heartbeats for different nodes don't contend.
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    # Task IDs dispatched to this node; deque append/popleft are atomic, so no lock.
+    queue: deque = field(default_factory=deque, repr=False, compare=False)
+    # (state key, /status details) reused while the node's state is unchanged.
+    details_cache: Optional[tuple] = field(default=None, repr=False, compare=False)
 
 
 # -----------------------------
@@ -148,28 +189,223 @@ class EdgeFeedback(BaseModel):
     )
 
 
-@dataclass
-class TrafficRow:
-    timestamp_utc: datetime
-    movement_type: str
-    runway: str
-    occupancy_seconds: int
+class TaskResult(BaseModel):
+    # Extra fields (timings, task_type, ...) are kept and stored with the result.
+    model_config = ConfigDict(extra="allow")
+
+    task_id: str = Field(..., min_length=1)
+    node_id: str = Field(..., min_length=1)
+    status: str  # "completed"; anything else is recorded as a failure
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+
+
+class TaskResultBatch(BaseModel):
+    results: List[TaskResult]
+
+
+# Indexed by (high + medium); "high" thresholds imply "medium" ones.
+CONGESTION_LEVELS = ("low", "medium", "high")
+XAI_THRESHOLDS = {
+    "density_high": 30,
+    "density_medium": 15,
+    "occupancy_high_percent": 70,
+    "occupancy_medium_percent": 40,
+    "spacing_penalty_minutes": 3.0,
+}
+# (metric, ascending thresholds, reason per band). Bands are picked with
+# bisect_left, so a value equal to a threshold stays in the lower band.
+XAI_BANDS = (
+    (
+        "traffic_density",
+        (XAI_THRESHOLDS["density_medium"], XAI_THRESHOLDS["density_high"]),
+        (
+            "Low traffic density (<=15/hr)",
+            "Moderate traffic density (1530/hr)",
+            "High traffic density (>30/hr)",
+        ),
+    ),
+    (
+        "runway_occupancy_percent",
+        (XAI_THRESHOLDS["occupancy_medium_percent"], XAI_THRESHOLDS["occupancy_high_percent"]),
+        (
+            "Low runway occupancy (<=40%)",
+            "Moderate runway occupancy (4070%)",
+            "High runway occupancy (>70%)",
+        ),
+    ),
+)
+MOVEMENT_TYPES = ("arrival", "departure")  # index == movement code in TrafficColumns
+MOVEMENT_CODES = {name: code for code, name in enumerate(MOVEMENT_TYPES)}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_ns(ts: datetime) -> int:
+    return (ts - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+@dataclass(slots=True)
+class TrafficColumns:
+    """Traffic movements stored column-wise, one NumPy array per field.
+
+    Rows are kept sorted by timestamp so time windows are contiguous slices.
+    """
+    ts: np.ndarray  # int64 nanoseconds since epoch (UTC)
+    mt: np.ndarray  # uint8 movement code, see MOVEMENT_TYPES
+    runway: np.ndarray  # str
+    occ: np.ndarray  # int32 occupancy seconds
+
+    @classmethod
+    def empty(cls) -> TrafficColumns:
+        return cls(
+            ts=np.empty(0, dtype=np.int64),
+            mt=np.empty(0, dtype=np.uint8),
+            runway=np.empty(0, dtype=str),
+            occ=np.empty(0, dtype=np.int32),
+        )
+
+    def __len__(self) -> int:
+        return int(self.ts.size)
+
+    def select(self, index: Any) -> TrafficColumns:
+        return TrafficColumns(ts=self.ts[index], mt=self.mt[index], runway=self.runway[index], occ=self.occ[index])
+
+    def sort(self) -> TrafficColumns:
+        if self.ts.size > 1 and bool(np.any(self.ts[1:] < self.ts[:-1])):
+            return self.select(np.argsort(self.ts, kind="stable"))
+        return self
+
+    def since(self, ts_ns: int, inclusive: bool = True) -> TrafficColumns:
+        """Rows at (or strictly after) ts_ns, found by binary search"""
+        start = np.searchsorted(self.ts, ts_ns, side="left" if inclusive else "right")
+        return self.select(slice(int(start), None))
+
+    def timestamp_strings(self) -> List[str]:
+        """ISO-8601 UTC timestamps, formatted in one call instead of per row"""
+        return np.char.add(
+            np.datetime_as_string(self.ts.view("datetime64[ns]"), unit="us"), "+00:00"
+        ).tolist()
+
+    def to_movements(self) -> List[Dict[str, Any]]:
+        """Serializable row dicts for task payloads"""
+        stamps = self.timestamp_strings()
+        return [
+            {
+                "timestamp_utc": ts,
+                "movement_type": MOVEMENT_TYPES[mt],
+                "runway": runway,
+                "occupancy_seconds": occ,
+            }
+            for ts, mt, runway, occ in zip(
+                stamps, self.mt.tolist(), self.runway.tolist(), self.occ.tolist()
+            )
+        ]
 
 
 # -----------------------------
 # Task and Node Management
 # -----------------------------
+FORECAST_POINTS = 5  # Recent results averaged by the moving-average forecast
+FORECAST_KEYS = (
+    "traffic_density",
+    "runway_occupancy_percent",
+    "arrivals",
+    "departures",
+    "congestion_score",
+)
+
+
+class RollingMeans:
+    """Per-key means over the last N metric dicts, updated in O(1) per append.
+
+    Missing or non-numeric values are skipped, so each key keeps its own count.
+    """
+
+    def __init__(self, size: int, keys: tuple):
+        self.keys = keys
+        self._buf: deque = deque(maxlen=size)
+        self._sums = dict.fromkeys(keys, 0.0)
+        self._counts = dict.fromkeys(keys, 0)
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def append(self, metrics: Dict[str, Any]) -> None:
+        # Filter before touching the buffer so bad input can't poison the sums
+        values = {}
+        for key in self.keys:
+            value = metrics.get(key)
+            values[key] = value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+        if len(self._buf) == self._buf.maxlen:
+            self._apply(self._buf[0], -1)
+        self._buf.append(values)
+        self._apply(values, 1)
+
+    def _apply(self, values: Dict[str, Any], sign: int) -> None:
+        for key, value in values.items():
+            if value is not None:
+                self._sums[key] += sign * value
+                self._counts[key] += sign
+                if not self._counts[key]:
+                    self._sums[key] = 0.0  # Drop accumulated float error
+
+    def mean(self, key: str) -> Optional[float]:
+        count = self._counts[key]
+        return round(self._sums[key] / count, 2) if count else None
+
+
+# Node fields that change on every status build; kept out of the ETag so an
+# unchanged system revalidates as 304 (clients age from last_heartbeat instead).
+NODE_AGE_FIELDS = ("seconds_since_heartbeat", "seconds_since_activity")
+
+
+def _weak_etag(body: bytes) -> str:
+    return 'W/"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
 class DistributedTaskManager:
     """Manages task distribution and node tracking with full transparency"""
     
     def __init__(self):
-        self._lock = threading.Lock()
+        # Lock order: _tasks_lock before _nodes_lock or any NodeInfo.lock;
+        # _results_lock is never held together with another lock.
+        self._tasks_lock = threading.Lock()  # _tasks, task state and indexes
+        self._results_lock = threading.Lock()  # _latest_result, _history
+        self._nodes_lock = threading.Lock()  # inserts into _nodes
         self._tasks: Dict[str, Task] = {}
         self._nodes: Dict[str, NodeInfo] = {}
-        self._task_queue: deque = deque()
-        self._task_counter = 0
+        # Tasks wait in per-node queues (NodeInfo.queue); this one holds work
+        # created while fewer than two nodes were alive, re-queued after a
+        # timeout, or left behind by a dead node. Any node may pull from it.
+        self._orphan_queue: deque = deque()
+        self._id_seq = itertools.count(1)  # next() is atomic, so IDs need no lock
+        # Indexes maintained on every transition so get_status never scans _tasks.
+        self._by_status: Dict[TaskStatus, set] = {s: set() for s in TaskStatus}
+        self._recent: deque = deque(maxlen=20)  # newest tasks, oldest first
+        self._latest_completed: Optional[Task] = None
+        self._finished: deque = deque()  # completed/failed task IDs, oldest first
+        # Encoded task_data by content hash, with the number of live tasks using it
+        self._payloads: Dict[str, bytes] = {}
+        self._payload_refs: Counter = Counter()
+        # Status transitions since startup, and the totals last logged
+        self._transitions: Counter = Counter()
+        self._logged_transitions: Counter = Counter()
+        # Min-heap of (assignment deadline, task_id); entries for tasks that have
+        # since finished or been re-assigned are skipped when popped.
+        self._deadlines: List[tuple] = []
+        # Bumped by every task/node state change; a cached status is reused only
+        # while the version matches and it is younger than STATUS_CACHE_SECONDS.
+        self._version = 0
+        # Bumped from several threads; next() is atomic where += could lose a bump.
+        # Values are unique, so a change is seen even if two bumps land out of order.
+        self._version_seq = itertools.count(1)
+        # Fixed per process, so a heartbeat's derived wall-clock time is stable across builds
+        self._wall_offset = time.time() - time.monotonic()
+        # (version, monotonic time, status, json, etag)
+        self._status_cache: Optional[tuple] = None
+        self._status_html: Optional[tuple] = None  # (status cache entry, rendered fragment, etag)
         self._latest_result: Optional[Dict[str, Any]] = None
-        self._history: deque = deque(maxlen=50)
+        self._history = RollingMeans(FORECAST_POINTS, FORECAST_KEYS)
 
     def _extract_metrics(self, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         if not result:
@@ -180,11 +416,9 @@ class DistributedTaskManager:
         return result
 
     def _classify_congestion(self, density: float, occupancy: float) -> str:
-        if density > 30 or occupancy > 70:
-            return "high"
-        if density > 15 or occupancy > 40:
-            return "medium"
-        return "low"
+        high = density > 30 or occupancy > 70
+        medium = density > 15 or occupancy > 40
+        return CONGESTION_LEVELS[high + medium]
 
     def _build_xai(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
         density = metrics.get("traffic_density")
@@ -197,22 +431,12 @@ class DistributedTaskManager:
         congestion_level = metrics.get("congestion_level")
 
         reasons = []
-        if density is not None:
-            if density > 30:
-                reasons.append("High traffic density (>30/hr)")
-            elif density > 15:
-                reasons.append("Moderate traffic density (1530/hr)")
-            else:
-                reasons.append("Low traffic density (<=15/hr)")
-        if occupancy is not None:
-            if occupancy > 70:
-                reasons.append("High runway occupancy (>70%)")
-            elif occupancy > 40:
-                reasons.append("Moderate runway occupancy (4070%)")
-            else:
-                reasons.append("Low runway occupancy (<=40%)")
+        for key, thresholds, messages in XAI_BANDS:
+            value = metrics.get(key)
+            if value is not None:
+                reasons.append(messages[bisect.bisect_left(thresholds, value)])
         if min_spacing is not None and min_spacing > 0:
-            if min_spacing < 3.0:
+            if min_spacing < XAI_THRESHOLDS["spacing_penalty_minutes"]:
                 reasons.append("Tight spacing (<3 min) increases score")
             else:
                 reasons.append("Spacing acceptable (>=3 min)")
@@ -234,24 +458,14 @@ class DistributedTaskManager:
                 "min_spacing_minutes": min_spacing,
                 "arrival_departure_imbalance_pct": round(imbalance, 1) if imbalance is not None else None,
             },
-            "thresholds": {
-                "density_high": 30,
-                "density_medium": 15,
-                "occupancy_high_percent": 70,
-                "occupancy_medium_percent": 40,
-                "spacing_penalty_minutes": 3.0,
-            },
+            "thresholds": XAI_THRESHOLDS,
         }
 
     def _build_forecast(self) -> Optional[Dict[str, Any]]:
         if not self._history:
             return None
-        # Use last N points for a simple moving average forecast.
-        window = list(self._history)[-5:]
-        def avg(key: str) -> Optional[float]:
-            vals = [m.get(key) for m in window if m.get(key) is not None]
-            return round(sum(vals) / len(vals), 2) if vals else None
-
+        # Simple moving average over the last FORECAST_POINTS results.
+        avg = self._history.mean
         density = avg("traffic_density")
         occupancy = avg("runway_occupancy_percent")
         arrivals = avg("arrivals")
@@ -264,7 +478,7 @@ class DistributedTaskManager:
 
         return {
             "method": "moving_average",
-            "window_points": len(window),
+            "window_points": len(self._history),
             "predicted_congestion_level": predicted_level,
             "predicted_congestion_score": score,
             "predicted_traffic_density_per_hr": density,
@@ -275,37 +489,107 @@ class DistributedTaskManager:
         
     def register_node(self, node_id: str) -> None:
         """Register or update node heartbeat"""
-        with self._lock:
-            now = datetime.now(timezone.utc)
-            if node_id not in self._nodes:
-                self._nodes[node_id] = NodeInfo(
-                    node_id=node_id,
-                    last_heartbeat=now,
-                    last_active_at=now,
-                    status="alive",
-                    tasks_assigned=0,
-                    tasks_completed=0,
-                    tasks_failed=0,
-                    current_task=None
-                )
-                logger.info(f" New node registered: {node_id}")
+        mono = time.monotonic()
+        node = self._nodes.get(node_id)
+        if node is None:
+            with self._nodes_lock:
+                node = self._nodes.get(node_id)
+                if node is None:
+                    self._nodes[node_id] = NodeInfo(
+                        node_id=node_id,
+                        last_heartbeat_mono=mono,
+                        last_active_at=datetime.now(timezone.utc),
+                        last_active_mono=mono,
+                        status="alive",
+                        tasks_assigned=0,
+                        tasks_completed=0,
+                        tasks_failed=0,
+                        current_task=None
+                    )
+                    self._version = next(self._version_seq)
+                    logger.info(" New node registered: %s", node_id)
+                    return
+        with node.lock:
+            node.last_heartbeat_mono = mono
+            # Update status based on heartbeat
+            if node.current_task is None:
+                node.status = "idle"
             else:
-                self._nodes[node_id].last_heartbeat = now
-                # Update status based on heartbeat
-                if self._nodes[node_id].current_task is None:
-                    self._nodes[node_id].status = "idle"
-                else:
-                    self._nodes[node_id].status = "working"
+                node.status = "working"
+
+    def _set_status(self, task: Task, status: TaskStatus) -> None:
+        """Move a task to a new status and update the index; hold _tasks_lock"""
+        self._by_status[task.status].discard(task.task_id)
+        task.status = status
+        self._by_status[status].add(task.task_id)
+        self._transitions[status] += 1
+        task.summary_cache = None
+
+    def _evict_finished(self) -> None:
+        """Drop the oldest finished tasks while over MAX_TASKS; hold _tasks_lock"""
+        while len(self._tasks) > MAX_TASKS and self._finished:
+            task = self._tasks.pop(self._finished.popleft(), None)
+            if task is not None:  # IDs can repeat if a completed task is later failed
+                self._by_status[task.status].discard(task.task_id)
+                self._release_payload(task.payload_sha)
+
+    def _release_payload(self, sha: Optional[str]) -> None:
+        """Drop one task's reference to a payload; hold _tasks_lock"""
+        if sha is None:
+            return
+        self._payload_refs[sha] -= 1
+        if self._payload_refs[sha] <= 0:
+            del self._payload_refs[sha]
+            self._payloads.pop(sha, None)
+
+    def _snapshot_nodes(self) -> List[NodeInfo]:
+        with self._nodes_lock:
+            return list(self._nodes.values())
+
+    def _pick_queue(self, alive: List[NodeInfo]) -> deque:
+        """Power-of-two-choices: the shorter queue of two random live nodes"""
+        if len(alive) < 2:
+            return self._orphan_queue
+        a, b = random.sample(alive, 2)
+        return min(a.queue, b.queue, key=len)
+
+    def _pop_task_id(self, node_id: str) -> Optional[str]:
+        """Own queue first, then orphans, then steal from the longest peer queue"""
+        node = self._nodes.get(node_id)
+        queues = [node.queue] if node is not None else []
+        queues.append(self._orphan_queue)
+        for q in queues:
+            try:
+                return q.popleft()
+            except IndexError:
+                continue
+        peers = [n.queue for n in self._snapshot_nodes() if n.node_id != node_id]
+        try:
+            return max(peers, key=len).popleft() if peers else None
+        except IndexError:
+            return None
     
     def create_task(self, task_type: str, window_minutes: int, data: Optional[Dict[str, Any]] = None) -> str:
         """Create a new task and add to queue"""
-        with self._lock:
-            self._task_counter += 1
-            task_id = f"task-{self._task_counter:05d}"
-            now = datetime.now(timezone.utc)
-            
-            task = Task(
-                task_id=task_id,
+        return self.create_tasks(task_type, window_minutes, data, 1)[0]
+
+    def create_tasks(
+        self,
+        task_type: str,
+        window_minutes: int,
+        data: Optional[Dict[str, Any]],
+        count: int,
+        created_at: Optional[datetime] = None,
+    ) -> List[str]:
+        """Create count tasks sharing one payload, taking the task lock once"""
+        now = created_at or datetime.now(timezone.utc)
+        data_json = sha = None
+        if data:
+            data_json = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            sha = hashlib.sha256(data_json).hexdigest()[:16]
+        tasks = [
+            Task(
+                task_id=f"task-{next(self._id_seq):05d}",
                 type=task_type,
                 node_id=None,
                 status=TaskStatus.PENDING,
@@ -314,261 +598,414 @@ class DistributedTaskManager:
                 completed_at=None,
                 window_minutes=window_minutes,
                 result=None,
-                task_data=data
+                task_data=data,
+                payload_sha=sha
             )
-            
-            self._tasks[task_id] = task
-            self._task_queue.append(task_id)
-            
-            logger.info(f" Task created: {task_id} (type: {task_type})")
-            return task_id
+            for _ in range(count)
+        ]
+        task_ids = [task.task_id for task in tasks]
+        
+        with self._tasks_lock:
+            if sha is not None:
+                self._payloads.setdefault(sha, data_json)
+                self._payload_refs[sha] += count
+            for task in tasks:
+                self._tasks[task.task_id] = task
+                self._recent.append(task)
+            self._by_status[TaskStatus.PENDING].update(task_ids)
+            self._evict_finished()
+            self._version = next(self._version_seq)
+        alive = [n for n in self._snapshot_nodes() if n.status != "dead"]
+        for task_id in task_ids:
+            self._pick_queue(alive).append(task_id)
+        
+        logger.info(" Tasks created: %s (type: %s)", ", ".join(task_ids), task_type)
+        return task_ids
     
-    def get_next_task(self, node_id: str) -> Optional[Dict[str, Any]]:
-        """Assign next task to requesting node"""
-        with self._lock:
-            if not self._task_queue:
+    def get_next_task(self, node_id: str) -> Optional[bytes]:
+        """Assign next task to requesting node and return its JSON body"""
+        now = datetime.now(timezone.utc)
+        mono = time.monotonic()
+        while True:
+            task_id = self._pop_task_id(node_id)
+            if task_id is None:
                 return None
-            
-            task_id = self._task_queue.popleft()
-            task = self._tasks[task_id]
-            now = datetime.now(timezone.utc)
-            
-            # Update task
-            task.node_id = node_id
-            task.status = TaskStatus.ASSIGNED
-            task.assigned_at = now
-            
-            # Update node
-            if node_id in self._nodes:
-                self._nodes[node_id].tasks_assigned += 1
-                self._nodes[node_id].current_task = task_id
-                self._nodes[node_id].status = "working"
-                self._nodes[node_id].last_active_at = now
-            
-            logger.info(f" Task {task_id} assigned to {node_id}")
-            
-            # Include task data in response
-            task_payload = {
-                "task_id": task_id,
-                "type": task.type,
-                "window_minutes": task.window_minutes,
-                "assigned_at": task.assigned_at.isoformat(),
-                "node_id": node_id
-            }
-            
-            # Add task-specific data if available
-            if task.task_data:
-                task_payload["data"] = task.task_data
-            
-            return task_payload
+            with self._tasks_lock:
+                # A re-queued task may since have been completed late, or evicted
+                task = self._tasks.get(task_id)
+                if task is None or task.status != TaskStatus.PENDING:
+                    continue
+                # Update task
+                task.node_id = node_id
+                self._set_status(task, TaskStatus.ASSIGNED)
+                task.assigned_at = now
+                task.assigned_at_mono = mono
+                heapq.heappush(self._deadlines, (mono + TASK_TIMEOUT_SECONDS, task_id))
+                self._version = next(self._version_seq)
+                break
+        
+        # Update node
+        node = self._nodes.get(node_id)
+        if node is not None:
+            with node.lock:
+                node.tasks_assigned += 1
+                node.current_task = task_id
+                node.status = "working"
+                node.last_active_at = now
+                node.last_active_mono = mono
+        
+        logger.debug(" Task %s assigned to %s", task_id, node_id)
+        
+        # Include task data in response
+        task_payload = {
+            "task_id": task_id,
+            "type": task.type,
+            "window_minutes": task.window_minutes,
+            "assigned_at": now.isoformat(),
+            "node_id": node_id
+        }
+        
+        # Task data is served separately so nodes can cache it by hash
+        if task.payload_sha is not None:
+            task_payload["payload_url"] = f"/payload/{task.payload_sha}"
+        
+        return json.dumps(task_payload, separators=(",", ":")).encode("utf-8")
+
+    def log_activity(self) -> None:
+        """One INFO line for the task transitions since the last call"""
+        with self._tasks_lock:
+            totals = self._transitions.copy()
+        delta = totals - self._logged_transitions
+        self._logged_transitions = totals
+        if delta:
+            logger.info(
+                " Task activity: %d assigned, %d completed, %d failed, %d re-queued",
+                delta[TaskStatus.ASSIGNED],
+                delta[TaskStatus.COMPLETED],
+                delta[TaskStatus.FAILED],
+                delta[TaskStatus.PENDING],
+            )
+
+    def get_payload(self, sha: str) -> Optional[bytes]:
+        """Encoded task_data for a payload hash, if any live task still uses it"""
+        with self._tasks_lock:
+            return self._payloads.get(sha)
     
     def complete_task(self, task_id: str, node_id: str, result: Dict[str, Any]) -> None:
         """Mark task as completed"""
-        with self._lock:
-            if task_id not in self._tasks:
-                logger.warning(f" Unknown task completion: {task_id}")
+        metrics = self._extract_metrics(result)
+        now = datetime.now(timezone.utc)
+        with self._tasks_lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                logger.warning(" Unknown task completion: %s", task_id)
                 return
             
-            task = self._tasks[task_id]
-            now = datetime.now(timezone.utc)
-            
-            task.status = TaskStatus.COMPLETED
+            self._set_status(task, TaskStatus.COMPLETED)
+            self._finished.append(task_id)
             task.completed_at = now
             task.result = result
+            latest = self._latest_completed
+            if result and (latest is None or task.created_at >= latest.created_at):
+                self._latest_completed = task
+            assigned_at = task.assigned_at
+        
+        with self._results_lock:
             self._latest_result = result
-            metrics = self._extract_metrics(result)
             if metrics:
                 self._history.append(metrics)
-            
-            # Update node
-            if node_id in self._nodes:
-                self._nodes[node_id].tasks_completed += 1
-                self._nodes[node_id].current_task = None
-                self._nodes[node_id].status = "idle"
-                self._nodes[node_id].last_active_at = now
-            
-            duration = (now - task.assigned_at).total_seconds() if task.assigned_at else 0
-            logger.info(f" Task {task_id} completed by {node_id} in {duration:.1f}s")
+        self._version = next(self._version_seq)  # After both updates, so a cached status can't miss one
+        
+        # Update node
+        node = self._nodes.get(node_id)
+        if node is not None:
+            with node.lock:
+                node.tasks_completed += 1
+                node.current_task = None
+                node.status = "idle"
+                node.last_active_at = now
+                node.last_active_mono = time.monotonic()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            duration = (now - assigned_at).total_seconds() if assigned_at else 0
+            logger.debug(" Task %s completed by %s in %.1fs", task_id, node_id, duration)
     
     def fail_task(self, task_id: str, node_id: str, reason: str) -> None:
         """Mark task as failed"""
-        with self._lock:
-            if task_id not in self._tasks:
+        now = datetime.now(timezone.utc)
+        with self._tasks_lock:
+            task = self._tasks.get(task_id)
+            if task is None:
                 return
             
-            task = self._tasks[task_id]
-            now = datetime.now(timezone.utc)
-            
-            task.status = TaskStatus.FAILED
+            self._set_status(task, TaskStatus.FAILED)
+            self._finished.append(task_id)
             task.completed_at = now
             task.result = {"error": reason}
-            
-            if node_id in self._nodes:
-                self._nodes[node_id].tasks_failed += 1
-                self._nodes[node_id].current_task = None
-                self._nodes[node_id].status = "idle"
-                self._nodes[node_id].last_active_at = now
-            
-            logger.warning(f" Task {task_id} failed on {node_id}: {reason}")
+            self._version = next(self._version_seq)
+        
+        node = self._nodes.get(node_id)
+        if node is not None:
+            with node.lock:
+                node.tasks_failed += 1
+                node.current_task = None
+                node.status = "idle"
+                node.last_active_at = now
+                node.last_active_mono = time.monotonic()
+        
+        logger.warning(" Task %s failed on %s: %s", task_id, node_id, reason)
     
     def check_timeouts(self) -> None:
         """Check for timed out tasks and dead nodes"""
-        with self._lock:
-            now = datetime.now(timezone.utc)
-            
-            # Check for dead nodes
-            for node_id, node in self._nodes.items():
-                if (now - node.last_heartbeat).total_seconds() > NODE_TIMEOUT_SECONDS:
+        mono = time.monotonic()
+        
+        # Check for dead nodes
+        for node in self._snapshot_nodes():
+            with node.lock:
+                if mono - node.last_heartbeat_mono > NODE_TIMEOUT_SECONDS:
                     if node.status != "dead":
                         node.status = "dead"
-                        logger.warning(f" Node {node_id} marked as dead (no heartbeat)")
-            
-            # Check for timed out tasks
-            for task_id, task in self._tasks.items():
-                if task.status == TaskStatus.ASSIGNED and task.assigned_at:
-                    if (now - task.assigned_at).total_seconds() > TASK_TIMEOUT_SECONDS:
-                        task.status = TaskStatus.TIMEOUT
-                        logger.warning(f" Task {task_id} timed out on {task.node_id}")
-                        # Re-queue the task
-                        task.status = TaskStatus.PENDING
-                        task.node_id = None
-                        task.assigned_at = None
-                        self._task_queue.append(task_id)
-                        logger.info(f" Task {task_id} re-queued after timeout")
+                        self._version = next(self._version_seq)
+                        logger.warning(" Node %s marked as dead (no heartbeat)", node.node_id)
+            # Hand a dead node's backlog to the shared queue.
+            if node.status == "dead":
+                while node.queue:
+                    try:
+                        self._orphan_queue.append(node.queue.popleft())
+                    except IndexError:
+                        break
+        
+        # Check for timed out tasks
+        with self._tasks_lock:
+            while self._deadlines and self._deadlines[0][0] < mono:
+                _, task_id = heapq.heappop(self._deadlines)
+                task = self._tasks.get(task_id)
+                if task is None or task.status != TaskStatus.ASSIGNED or task.assigned_at_mono is None:
+                    continue
+                if mono - task.assigned_at_mono > TASK_TIMEOUT_SECONDS:
+                    self._set_status(task, TaskStatus.TIMEOUT)
+                    logger.warning(" Task %s timed out on %s", task_id, task.node_id)
+                    # Re-queue the task
+                    self._set_status(task, TaskStatus.PENDING)
+                    task.node_id = None
+                    task.assigned_at = None
+                    task.assigned_at_mono = None
+                    self._orphan_queue.append(task_id)
+                    self._version = next(self._version_seq)
+                    logger.info(" Task %s re-queued after timeout", task_id)
     
+    def _task_summary(self, t: Task) -> Dict[str, Any]:
+        """Cached /status view of a task; hold _tasks_lock"""
+        if t.summary_cache is None:
+            t.summary_cache = {
+                "task_id": t.task_id,
+                "type": t.type,
+                "status": t.status.value,
+                "node_id": t.node_id,
+                "created_at": t.created_at.isoformat(),
+                "assigned_at": t.assigned_at.isoformat() if t.assigned_at else None,
+                "completed_at": t.completed_at.isoformat() if t.completed_at else None,
+                "duration_seconds": (
+                    (t.completed_at - t.assigned_at).total_seconds()
+                    if t.completed_at and t.assigned_at else None
+                ),
+                "window_minutes": t.window_minutes,
+                "task_data_summary": {
+                    "traffic_movements": len(t.task_data.get("traffic_movements", [])) if t.task_data else None,
+                    "window_start": t.task_data.get("window_start") if t.task_data else None,
+                    "window_end": t.task_data.get("window_end") if t.task_data else None,
+                    "airport_code": t.task_data.get("airport_code") if t.task_data else None,
+                    "runway": t.task_data.get("runway") if t.task_data else None,
+                },
+                "result_summary": (
+                    {
+                        "congestion_level": (
+                            t.result.get("result", t.result).get("congestion_level")
+                            if t.result else None
+                        ),
+                        "congestion_score": (
+                            t.result.get("result", t.result).get("congestion_score")
+                            if t.result else None
+                        ),
+                        "total_movements": (
+                            t.result.get("result", t.result).get("total_movements")
+                            if t.result else None
+                        ),
+                        "traffic_density": (
+                            t.result.get("result", t.result).get("traffic_density")
+                            if t.result else None
+                        ),
+                        "runway_occupancy_percent": (
+                            t.result.get("result", t.result).get("runway_occupancy_percent")
+                            if t.result else None
+                        ),
+                    } if t.result else None
+                ),
+            }
+        return t.summary_cache
+
+    def _cached_status(self) -> tuple:
+        # Read the version before building so a concurrent change invalidates it.
+        version = self._version
+        cached = self._status_cache
+        if (
+            cached is not None
+            and cached[0] == version
+            and time.monotonic() - cached[1] < STATUS_CACHE_SECONDS
+        ):
+            return cached
+        status = self._build_status()
+        # Encode everything except the leading timestamp once per build, so
+        # serving the cached status only splices in a fresh timestamp.
+        payload = {k: v for k, v in status.items() if k != "timestamp"}
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        nodes = payload["nodes"]
+        tagged = {**payload, "nodes": {**nodes, "details": [
+            {k: v for k, v in d.items() if k not in NODE_AGE_FIELDS} for d in nodes["details"]
+        ]}}
+        etag = _weak_etag(json.dumps(tagged, separators=(",", ":")).encode())
+        cached = (version, time.monotonic(), status, body, etag)
+        self._status_cache = cached
+        return cached
+
+    @property
+    def version(self) -> int:
+        """Changes whenever task or node state changes"""
+        return self._version
+
     def get_status(self) -> Dict[str, Any]:
-        """Get comprehensive system status"""
-        with self._lock:
-            now = datetime.now(timezone.utc)
-            latest_completed_from_tasks = None
-            for t in sorted(self._tasks.values(), key=lambda x: x.created_at, reverse=True):
-                if t.status == TaskStatus.COMPLETED and t.result:
-                    latest_completed_from_tasks = t.result
-                    break
+        """Get comprehensive system status, reusing a very recent build"""
+        return {**self._cached_status()[2], "timestamp": datetime.now(timezone.utc).isoformat()}
+
+    def get_status_json(self) -> bytes:
+        """get_status() as encoded JSON"""
+        return self.get_status_json_tagged()[1]
+
+    def get_status_json_tagged(self) -> tuple:
+        """(etag, get_status_json()); the etag ignores the per-call timestamp"""
+        cached = self._cached_status()
+        body = cached[3]
+        timestamp = datetime.now(timezone.utc).isoformat()
+        return cached[4], b'{"timestamp":"' + timestamp.encode() + b'",' + body[1:]
+
+    def get_status_html(self) -> str:
+        """Dashboard fragment for the cached status, rendered once per build"""
+        return self.get_status_html_tagged()[1]
+
+    def get_status_html_tagged(self) -> tuple:
+        """(etag, get_status_html()); shares the status etag, as ages tick client-side"""
+        cached = self._cached_status()
+        rendered = self._status_html
+        if rendered is None or rendered[0] is not cached:
+            fragment = render_status_html(cached[2])
+            rendered = (cached, fragment, cached[4])
+            self._status_html = rendered
+        return rendered[2], rendered[1]
+
+    def _build_status(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        mono = time.monotonic()
+        nodes = self._snapshot_nodes()
+        with self._tasks_lock:
+            latest = self._latest_completed
+            latest_completed_from_tasks = (
+                latest.result if latest is not None and latest.status == TaskStatus.COMPLETED else None
+            )
 
             # Map currently assigned tasks to nodes for accurate working status
             assigned_by_node: Dict[str, str] = {}
-            for t in self._tasks.values():
-                if t.status == TaskStatus.ASSIGNED and t.node_id:
-                    assigned_by_node[t.node_id] = t.task_id
+            for task_id in self._by_status[TaskStatus.ASSIGNED]:
+                t = self._tasks[task_id]
+                if t.node_id:
+                    assigned_by_node[t.node_id] = task_id
+            
+            # Task statistics
+            by_status = self._by_status
             
-            # Node statistics (derive status from heartbeat + current_task for accuracy)
-            for n in self._nodes.values():
-                if (now - n.last_heartbeat).total_seconds() > NODE_TIMEOUT_SECONDS:
+            queue_size = len(self._orphan_queue) + sum(len(n.queue) for n in nodes)
+
+            tasks_status = {
+                "total": len(self._tasks),
+                "pending": len(by_status[TaskStatus.PENDING]),
+                "assigned": len(by_status[TaskStatus.ASSIGNED]),
+                "completed": len(by_status[TaskStatus.COMPLETED]),
+                "failed": len(by_status[TaskStatus.FAILED]),
+                "queue_size": queue_size,
+                "recent_tasks": [self._task_summary(t) for t in reversed(self._recent)]
+            }
+
+        # Explanations and forecast read only the result history, so they are
+        # built without holding up task dispatch.
+        with self._results_lock:
+            xai = None
+            latest_result = self._latest_result
+            latest_metrics = self._extract_metrics(latest_result) if latest_result else None
+            if latest_metrics:
+                xai = self._build_xai(latest_metrics)
+            forecast = self._build_forecast()
+
+        # Node statistics (derive status from heartbeat + current_task for accuracy)
+        node_details = []
+        status_counts: Counter = Counter()
+        for n in nodes:
+            with n.lock:
+                since_heartbeat = mono - n.last_heartbeat_mono
+                since_activity = mono - n.last_active_mono
+                if since_heartbeat > NODE_TIMEOUT_SECONDS:
                     n.status = "dead"
                 elif n.node_id in assigned_by_node:
                     n.current_task = assigned_by_node[n.node_id]
                     n.status = "working"
-                elif (now - n.last_active_at).total_seconds() <= WORKING_GRACE_SECONDS:
+                elif since_activity <= WORKING_GRACE_SECONDS:
                     n.status = "working"
                 else:
                     n.status = "idle"
+                key = (
+                    n.status, n.current_task, n.last_active_mono,
+                    n.tasks_assigned, n.tasks_completed, n.tasks_failed,
+                )
+                if n.details_cache is None or n.details_cache[0] != key:
+                    n.details_cache = (key, {
+                        "node_id": n.node_id,
+                        "status": n.status,
+                        "last_heartbeat": None,  # time-dependent, filled below
+                        "last_active_at": n.last_active_at.isoformat(),
+                        "seconds_since_heartbeat": None,
+                        "seconds_since_activity": None,
+                        "tasks_assigned": n.tasks_assigned,
+                        "tasks_completed": n.tasks_completed,
+                        "tasks_failed": n.tasks_failed,
+                        "current_task": n.current_task
+                    })
+            details = dict(n.details_cache[1])
+            details["last_heartbeat"] = datetime.fromtimestamp(
+                self._wall_offset + n.last_heartbeat_mono, timezone.utc
+            ).isoformat()
+            details["seconds_since_heartbeat"] = since_heartbeat
+            details["seconds_since_activity"] = since_activity
+            node_details.append(details)
+            status_counts[details["status"]] += 1
 
-            alive_nodes = [n for n in self._nodes.values() if n.status in ["idle", "working"]]
-            working_nodes = [n for n in self._nodes.values() if n.status == "working"]
-            dead_nodes = [n for n in self._nodes.values() if n.status == "dead"]
-            
-            # Task statistics
-            pending_tasks = [t for t in self._tasks.values() if t.status == TaskStatus.PENDING]
-            assigned_tasks = [t for t in self._tasks.values() if t.status == TaskStatus.ASSIGNED]
-            completed_tasks = [t for t in self._tasks.values() if t.status == TaskStatus.COMPLETED]
-            failed_tasks = [t for t in self._tasks.values() if t.status == TaskStatus.FAILED]
-            
-            xai = None
-            latest_metrics = self._extract_metrics(self._latest_result) if self._latest_result else None
-            if latest_metrics:
-                xai = self._build_xai(latest_metrics)
-            forecast = self._build_forecast()
-
-            return {
-                "timestamp": now.isoformat(),
-                "server_file": __file__,
-                "node_timeout_seconds": NODE_TIMEOUT_SECONDS,
-                "working_grace_seconds": WORKING_GRACE_SECONDS,
-                "nodes": {
-                    "total": len(self._nodes),
-                    "alive": len(alive_nodes),
-                    "working": len(working_nodes),
-                    "dead": len(dead_nodes),
-                    "details": [
-                        {
-                            "node_id": n.node_id,
-                            "status": n.status,
-                            "last_heartbeat": n.last_heartbeat.isoformat(),
-                            "last_active_at": n.last_active_at.isoformat(),
-                            "seconds_since_heartbeat": (now - n.last_heartbeat).total_seconds(),
-                            "seconds_since_activity": (now - n.last_active_at).total_seconds(),
-                            "tasks_assigned": n.tasks_assigned,
-                            "tasks_completed": n.tasks_completed,
-                            "tasks_failed": n.tasks_failed,
-                            "current_task": n.current_task
-                        }
-                        for n in self._nodes.values()
-                    ]
-                },
-                "tasks": {
-                    "total": len(self._tasks),
-                    "pending": len(pending_tasks),
-                    "assigned": len(assigned_tasks),
-                    "completed": len(completed_tasks),
-                    "failed": len(failed_tasks),
-                    "queue_size": len(self._task_queue),
-                    "recent_tasks": [
-                        {
-                            "task_id": t.task_id,
-                            "type": t.type,
-                            "status": t.status.value,
-                            "node_id": t.node_id,
-                            "created_at": t.created_at.isoformat(),
-                            "assigned_at": t.assigned_at.isoformat() if t.assigned_at else None,
-                            "completed_at": t.completed_at.isoformat() if t.completed_at else None,
-                            "duration_seconds": (
-                                (t.completed_at - t.assigned_at).total_seconds()
-                                if t.completed_at and t.assigned_at else None
-                            ),
-                            "window_minutes": t.window_minutes,
-                            "task_data_summary": {
-                                "traffic_movements": len(t.task_data.get("traffic_movements", [])) if t.task_data else None,
-                                "window_start": t.task_data.get("window_start") if t.task_data else None,
-                                "window_end": t.task_data.get("window_end") if t.task_data else None,
-                                "airport_code": t.task_data.get("airport_code") if t.task_data else None,
-                                "runway": t.task_data.get("runway") if t.task_data else None,
-                            },
-                            "result_summary": (
-                                {
-                                    "congestion_level": (
-                                        t.result.get("result", t.result).get("congestion_level")
-                                        if t.result else None
-                                    ),
-                                    "congestion_score": (
-                                        t.result.get("result", t.result).get("congestion_score")
-                                        if t.result else None
-                                    ),
-                                    "total_movements": (
-                                        t.result.get("result", t.result).get("total_movements")
-                                        if t.result else None
-                                    ),
-                                    "traffic_density": (
-                                        t.result.get("result", t.result).get("traffic_density")
-                                        if t.result else None
-                                    ),
-                                    "runway_occupancy_percent": (
-                                        t.result.get("result", t.result).get("runway_occupancy_percent")
-                                        if t.result else None
-                                    ),
-                                } if t.result else None
-                            ),
-                        }
-                        for t in sorted(self._tasks.values(), key=lambda x: x.created_at, reverse=True)[:20]
-                    ]
-                },
-                "latest_result": self._latest_result,
-                "latest_result_from_tasks": latest_completed_from_tasks,
-                "latest_result_present": self._latest_result is not None,
-                "latest_metrics": latest_metrics,
-                "xai": xai,
-                "forecast": forecast
-            }
+        return {
+            "timestamp": now.isoformat(),
+            "server_file": __file__,
+            "node_timeout_seconds": NODE_TIMEOUT_SECONDS,
+            "working_grace_seconds": WORKING_GRACE_SECONDS,
+            "nodes": {
+                "total": len(node_details),
+                "alive": status_counts["idle"] + status_counts["working"],
+                "working": status_counts["working"],
+                "dead": status_counts["dead"],
+                "details": node_details
+            },
+            "tasks": tasks_status,
+            "latest_result": latest_result,
+            "latest_result_from_tasks": latest_completed_from_tasks,
+            "latest_result_present": latest_result is not None,
+            "latest_metrics": latest_metrics,
+            "xai": xai,
+            "forecast": forecast
+        }
 
 
 # -----------------------------
@@ -577,96 +1014,153 @@ class DistributedTaskManager:
 class DataLoader:
     def __init__(self, path: Path):
         self.path = path
+        # Parsed columns for the file version last read; rows are never
+        # mutated after parsing, so callers can share them.
+        self._cache_key: Optional[tuple] = None  # (st_mtime_ns, st_size)
+        self._cached = TrafficColumns.empty()
+
+    def _parse_timestamps(self, values: List[str]) -> np.ndarray:
+        """Parse ISO-8601 strings to int64 ns; unparseable values become NaT"""
+        # Timestamps are UTC; drop any offset (as replace(tzinfo=utc) did) so
+        # NumPy can parse the whole column in one call. Offsets follow the time
+        # part, which is the only place a "-" can mean one.
+        full = np.char.replace(np.array(values, dtype=str), " ", "T")
+        parts = np.char.rpartition(full, "T")
+        clock = np.char.partition(np.char.partition(parts[:, 2], "+")[:, 0], "-")[:, 0]
+        stripped = np.char.add(np.char.add(parts[:, 0], parts[:, 1]), clock)
+        raw = np.char.rstrip(np.where(parts[:, 1] == "T", stripped, full), "Z")
+        try:
+            return raw.astype("datetime64[ns]").view(np.int64)
+        except ValueError:
+            # Fall back to per-value parsing so one bad row does not drop the file.
+            parsed = np.empty(len(values), dtype="datetime64[ns]")
+            for i, value in enumerate(raw.tolist()):
+                try:
+                    parsed[i] = np.datetime64(value, "ns")
+                except ValueError:
+                    parsed[i] = np.datetime64("NaT")
+            return parsed.view(np.int64)
 
-    def _parse_row(self, row: Dict[str, str]) -> TrafficRow:
-        ts = datetime.fromisoformat(row["timestamp_utc"]).replace(tzinfo=timezone.utc)
-        return TrafficRow(
-            timestamp_utc=ts,
-            movement_type=row["movement_type"],
-            runway=row["runway"],
-            occupancy_seconds=int(row["occupancy_seconds"]),
-        )
-
-    def load(self) -> List[TrafficRow]:
-        if not self.path.exists():
-            return []
-        rows: List[TrafficRow] = []
+    def file_key(self) -> Optional[tuple]:
+        """(st_mtime_ns, st_size) of the file, or None if it is missing"""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        # Size guards against a rewrite landing within the filesystem's mtime granularity.
+        return (st.st_mtime_ns, st.st_size)
+
+    def load(self) -> TrafficColumns:
+        """Return the CSV rows, re-parsing only when the file has changed"""
+        key = self.file_key()
+        if key is None:
+            self._cache_key = None
+            return TrafficColumns.empty()
+        if key != self._cache_key:
+            self._cached = self._read()
+            self._cache_key = key
+        return self._cached
+
+    def _read(self) -> TrafficColumns:
+        ts_col: List[str] = []
+        mt_col: List[int] = []
+        runway_col: List[str] = []
+        occ_col: List[int] = []
         with self.path.open("r", newline="") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                return TrafficColumns.empty()
+            try:
+                # Resolve column positions once instead of building a dict per row.
+                ts_i = header.index("timestamp_utc")
+                mt_i = header.index("movement_type")
+                rw_i = header.index("runway")
+                occ_i = header.index("occupancy_seconds")
+            except ValueError:
+                logger.warning("Unexpected CSV header in %s: %s", self.path, header)
+                return TrafficColumns.empty()
             for row in reader:
                 try:
-                    rows.append(self._parse_row(row))
-                except Exception:
+                    ts = row[ts_i]
+                    mt = MOVEMENT_CODES[row[mt_i]]
+                    occ = int(row[occ_i])
+                except (IndexError, KeyError, ValueError):
                     continue
-        return rows
+                ts_col.append(ts)
+                mt_col.append(mt)
+                runway_col.append(row[rw_i])
+                occ_col.append(occ)
+        if not ts_col:
+            return TrafficColumns.empty()
+        cols = TrafficColumns(
+            ts=self._parse_timestamps(ts_col),
+            mt=np.array(mt_col, dtype=np.uint8),
+            runway=np.array(runway_col, dtype=str),
+            occ=np.array(occ_col, dtype=np.int32),
+        )
+        valid = cols.ts != np.iinfo(np.int64).min  # NaT
+        if not valid.all():
+            cols = cols.select(valid)
+        return cols.sort()
+
+
+# Realistic traffic patterns based on UTC hour of day, as lookup tables so a
+# whole generation run is drawn in a few vectorized calls.
+_HOURS = np.arange(24)
+# Peak hours: 6-9 AM and 5-8 PM (higher traffic)
+_PEAK_HOURS = ((_HOURS >= 6) & (_HOURS <= 9)) | ((_HOURS >= 17) & (_HOURS <= 20))
+# Night hours: 11 PM - 5 AM (lower traffic)
+_NIGHT_HOURS = (_HOURS >= 23) | (_HOURS <= 5)
+_TRAFFIC_PROBABILITY = np.where(_PEAK_HOURS, 0.9, np.where(_NIGHT_HOURS, 0.3, 0.65))
+_BASE_OCCUPANCY = np.where(_PEAK_HOURS, 80, np.where(_NIGHT_HOURS, 50, 65))
+# Slightly more arrivals in the morning, departures in the evening
+_ARRIVAL_CHANCE = np.where(
+    (_HOURS >= 6) & (_HOURS <= 12), 0.6, np.where((_HOURS >= 17) & (_HOURS <= 21), 0.4, 0.5)
+)
+_NS_PER_HOUR = 3600 * 10**9
 
 
 class DataGenerator:
     def __init__(self, path: Path):
         self.path = path
+        self._rng = np.random.default_rng()
 
-    def generate(self, hours: int = 2, interval_minutes: int = 5) -> None:
+    def generate(self, hours: int = 2, interval_minutes: int = 5) -> TrafficColumns:
+        """Write a fresh synthetic CSV and return the rows it contains"""
         now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=hours)
-
-        rows: List[TrafficRow] = []
-        current = start
-        while current <= now:
-            # Realistic traffic patterns based on time of day
-            hour = current.hour
-            
-            # Peak hours: 6-9 AM and 5-8 PM (higher traffic)
-            if (6 <= hour <= 9) or (17 <= hour <= 20):
-                traffic_probability = 0.9
-                base_occupancy = 80
-            # Night hours: 11 PM - 5 AM (lower traffic)
-            elif hour >= 23 or hour <= 5:
-                traffic_probability = 0.3
-                base_occupancy = 50
-            # Normal hours
-            else:
-                traffic_probability = 0.65
-                base_occupancy = 65
-            
-            if random.random() < traffic_probability:
-                # Realistic arrival/departure ratio (slightly more arrivals in morning, departures in evening)
-                if 6 <= hour <= 12:
-                    arrival_chance = 0.6
-                elif 17 <= hour <= 21:
-                    arrival_chance = 0.4
-                else:
-                    arrival_chance = 0.5
-                    
-                movement_type = "arrival" if random.random() < arrival_chance else "departure"
-                
-                # More realistic occupancy with variation
-                occupancy_seconds = base_occupancy + random.randint(-20, 40)
-                occupancy_seconds = max(30, min(180, occupancy_seconds))  # Clamp between 30-180s
-                
-                rows.append(
-                    TrafficRow(
-                        timestamp_utc=current,
-                        movement_type=movement_type,
-                        runway=RUNWAY,
-                        occupancy_seconds=occupancy_seconds,
-                    )
-                )
-            current += timedelta(minutes=interval_minutes)
+        step = timedelta(minutes=interval_minutes)
+        count = timedelta(hours=hours) // step + 1
+        start_ns = _to_ns(now - timedelta(hours=hours))
+        ts = start_ns + np.arange(count, dtype=np.int64) * (step // timedelta(microseconds=1) * 1000)
+        hour = (ts // _NS_PER_HOUR) % 24
+
+        present = self._rng.random(count) < _TRAFFIC_PROBABILITY[hour]
+        ts, hour = ts[present], hour[present]
+        arrival = self._rng.random(ts.size) < _ARRIVAL_CHANCE[hour]
+        # More realistic occupancy with variation, clamped between 30-180s
+        occ = np.clip(_BASE_OCCUPANCY[hour] + self._rng.integers(-20, 41, size=ts.size), 30, 180)
+        rows = TrafficColumns(
+            ts=ts,
+            mt=np.where(arrival, MOVEMENT_CODES["arrival"], MOVEMENT_CODES["departure"]).astype(np.uint8),
+            runway=np.full(ts.size, RUNWAY),
+            occ=occ.astype(np.int32),
+        )
 
-        with self.path.open("w", newline="") as f:
+        with self.path.open("w", newline="", buffering=CSV_WRITE_BUFFER_BYTES) as f:
             writer = csv.writer(f)
             writer.writerow(
                 ["timestamp_utc", "movement_type", "runway", "occupancy_seconds"]
             )
-            for r in rows:
-                writer.writerow(
-                    [
-                        r.timestamp_utc.isoformat(),
-                        r.movement_type,
-                        r.runway,
-                        r.occupancy_seconds,
-                    ]
+            writer.writerows(
+                zip(
+                    rows.timestamp_strings(),
+                    [MOVEMENT_TYPES[mt] for mt in rows.mt.tolist()],
+                    rows.runway.tolist(),
+                    rows.occ.tolist(),
                 )
+            )
+        return rows
 
 
 # -----------------------------
@@ -677,14 +1171,18 @@ class OpenSkyClient:
         self.base_url = OPENSKY_BASE_URL
         self.username = OPENSKY_USERNAME
         self.password = OPENSKY_PASSWORD
+        # One pooled keep-alive session so repeated queries reuse the TLS connection.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        self.session.mount("https://", adapter)
+        if self.username and self.password:
+            self.session.auth = (self.username, self.password)
 
     def _get(self, path: str, params: Dict[str, Any]) -> tuple[List[Dict[str, Any]], Optional[int]]:
         url = f"{self.base_url}{path}"
-        auth = None
-        if self.username and self.password:
-            auth = (self.username, self.password)
+        auth = self.session.auth
         try:
-            resp = requests.get(url, params=params, auth=auth, timeout=OPENSKY_TIMEOUT_SECONDS)
+            resp = self.session.get(url, params=params, timeout=OPENSKY_TIMEOUT_SECONDS)
             resp.raise_for_status()
             data = resp.json()
             return (data if isinstance(data, list) else []), resp.status_code
@@ -718,11 +1216,8 @@ class OpenSkyClient:
     def get_states(self, bbox: List[float]) -> tuple[List[List[Any]], Optional[int]]:
         params = {"lamin": bbox[0], "lamax": bbox[1], "lomin": bbox[2], "lomax": bbox[3]}
         url = f"{self.base_url}/states/all"
-        auth = None
-        if self.username and self.password:
-            auth = (self.username, self.password)
         try:
-            resp = requests.get(url, params=params, auth=auth, timeout=OPENSKY_TIMEOUT_SECONDS)
+            resp = self.session.get(url, params=params, timeout=OPENSKY_TIMEOUT_SECONDS)
             resp.raise_for_status()
             data = resp.json()
             states = data.get("states") if isinstance(data, dict) else None
@@ -742,15 +1237,77 @@ class OpenSkyClient:
 # -----------------------------
 # Metrics Calculation
 # -----------------------------
+class SlidingWindowAggregator:
+    """Per-minute ring buffer of (arrivals, departures, occupancy) totals.
+
+    Rows are folded into their minute bucket once on ingest; advancing the
+    head evicts expired buckets, so reading the window totals is O(1).
+    """
+
+    def __init__(self, window_minutes: int):
+        self.window_minutes = window_minutes
+        self.arrivals_total = 0
+        self.departures_total = 0
+        self.occupancy_total = 0
+        # Columns: arrivals, departures, occupancy seconds.
+        self._buckets = np.zeros((window_minutes, 3), dtype=np.int64)
+        self._head: Optional[int] = None  # newest minute covered by the window
+
+    def reset(self) -> None:
+        self._buckets[:] = 0
+        self.arrivals_total = self.departures_total = self.occupancy_total = 0
+        self._head = None
+
+    def advance(self, now: datetime) -> None:
+        self._advance_minute(int(now.timestamp() // 60))
+
+    def _advance_minute(self, minute: int) -> None:
+        if self._head is None:
+            self._head = minute
+            return
+        if minute <= self._head:
+            return
+        # Evict every bucket between the old head and the new one (at most one full lap).
+        slots = np.arange(max(self._head + 1, minute - self.window_minutes + 1), minute + 1) % self.window_minutes
+        arrivals, departures, occupancy = self._buckets[slots].sum(axis=0).tolist()
+        self.arrivals_total -= arrivals
+        self.departures_total -= departures
+        self.occupancy_total -= occupancy
+        self._buckets[slots] = 0
+        self._head = minute
+
+    def extend(self, ts_ns: np.ndarray, mt: np.ndarray, occ: np.ndarray) -> None:
+        """Fold a batch of movements into their buckets in one vectorized pass"""
+        if not ts_ns.size:
+            return
+        minutes = ts_ns // 60_000_000_000
+        self._advance_minute(int(minutes.max()))
+        live = minutes > self._head - self.window_minutes
+        slots = minutes[live] % self.window_minutes
+        departures = mt[live] == MOVEMENT_CODES["departure"]
+
+        n = self.window_minutes
+        # Departures land in bins [n, 2n) so one bincount yields both movement counts.
+        counts = np.bincount(slots + departures * n, minlength=2 * n)
+        delta = np.empty((n, 3), dtype=np.int64)
+        delta[:, 0] = counts[:n]
+        delta[:, 1] = counts[n:]
+        delta[:, 2] = np.bincount(slots, weights=occ[live], minlength=n)
+        self._buckets += delta
+
+        arrivals, departures_total, occupancy = delta.sum(axis=0).tolist()
+        self.arrivals_total += arrivals
+        self.departures_total += departures_total
+        self.occupancy_total += occupancy
+
+
 class MetricsCalculator:
-    def compute(
-        self, rows: List[TrafficRow], window_minutes: int, now: datetime
-    ) -> Dict[str, Any]:
-        window_start = now - timedelta(minutes=window_minutes)
-        window_rows = [r for r in rows if r.timestamp_utc >= window_start]
-
-        arrivals = sum(1 for r in window_rows if r.movement_type == "arrival")
-        departures = sum(1 for r in window_rows if r.movement_type == "departure")
+    def compute(self, window: SlidingWindowAggregator, now: datetime) -> Dict[str, Any]:
+        window.advance(now)
+        window_minutes = window.window_minutes
+
+        arrivals = window.arrivals_total
+        departures = window.departures_total
         total = arrivals + departures
 
         window_hours = window_minutes / 60.0
@@ -760,7 +1317,7 @@ class MetricsCalculator:
         arrival_rate = arrivals / window_hours if window_hours > 0 else 0.0
         departure_rate = departures / window_hours if window_hours > 0 else 0.0
 
-        occupancy_seconds = sum(r.occupancy_seconds for r in window_rows)
+        occupancy_seconds = window.occupancy_total
         estimated_runway_occupancy = (
             occupancy_seconds / window_seconds if window_seconds > 0 else 0.0
         )
@@ -782,28 +1339,35 @@ class MetricsCalculator:
         }
 
     def _classify_congestion(self, density: float, occupancy: float) -> str:
-        if density > 30 or occupancy > 0.7:
-            return "high"
-        if density > 15 or occupancy > 0.4:
-            return "medium"
-        return "low"
+        high = density > 30 or occupancy > 0.7
+        medium = density > 15 or occupancy > 0.4
+        return CONGESTION_LEVELS[high + medium]
 
 
 # -----------------------------
 # Summary Store
 # -----------------------------
 class SummaryStore:
+    """Holds the latest summary and its JSON encoding by reference.
+
+    Summaries are never mutated after being published, and rebinding a
+    single attribute is atomic, so readers need no lock. The JSON body is
+    encoded once per cycle rather than once per /summary request.
+    """
+
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._summary: Optional[Dict[str, Any]] = None
+        self._snapshot: Optional[tuple[Dict[str, Any], bytes]] = None
 
     def set(self, summary: Dict[str, Any]) -> None:
-        with self._lock:
-            self._summary = summary
+        self._snapshot = (summary, json.dumps(summary, separators=(",", ":")).encode("utf-8"))
 
     def get(self) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            return self._summary
+        snapshot = self._snapshot
+        return snapshot[0] if snapshot else None
+
+    def get_json(self) -> Optional[bytes]:
+        snapshot = self._snapshot
+        return snapshot[1] if snapshot else None
 
 
 # -----------------------------
@@ -818,116 +1382,415 @@ class CongestionEngine:
         self.generator = DataGenerator(data_file)
         self.calculator = MetricsCalculator()
         self.opensky = OpenSkyClient()
+        self.window = SlidingWindowAggregator(WINDOW_MINUTES)
+        self._ingested_until: Optional[int] = None  # newest ingested timestamp (ns)
         self._opensky_cache: Dict[str, Dict[str, Any]] = {}
-        self._thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
+        self._wake: Optional[asyncio.Event] = None  # set by request_cycle(), owned by run()
+        self._cycle_data_key: Optional[tuple] = None  # data file version the last cycle used
+
+    def _regenerate(self) -> TrafficColumns:
+        rows = self.generator.generate()
+        # Regenerated data replaces the file, so start the window over.
+        self.window.reset()
+        self._ingested_until = None
+        return rows
 
-    def _ensure_recent_data(self) -> None:
-        rows = self.loader.load()
-        if not rows:
-            self.generator.generate()
+    def _ingest(self, rows: TrafficColumns) -> None:
+        """Fold rows not seen yet into the sliding window"""
+        if self._ingested_until is not None:
+            rows = rows.since(self._ingested_until, inclusive=False)
+        if not len(rows):
             return
+        self.window.extend(rows.ts, rows.mt, rows.occ)
+        self._ingested_until = int(rows.ts[-1])
+
+    def _ensure_recent_data(self) -> TrafficColumns:
+        """Load the CSV once, regenerating it if stale; returns the rows to use"""
+        rows = self.loader.load()
+        if not len(rows):
+            return self._regenerate()
 
         now = datetime.now(timezone.utc)
         # Ensure we have data within the active window, not just "last 24h".
-        window_rows = [r for r in rows if r.timestamp_utc >= now - timedelta(minutes=WINDOW_MINUTES)]
-        if not window_rows:
-            self.generator.generate()
-
-    def _cycle(self) -> None:
-        while not self._stop_event.is_set():
-            self._ensure_recent_data()
-            now = datetime.now(timezone.utc)
-            rows = self.loader.load()
-            summary = self.calculator.compute(rows, WINDOW_MINUTES, now)
-            self.store.set(summary)
-            
-            # Prepare traffic data for analysis task
-            window_start = now - timedelta(minutes=WINDOW_MINUTES)
-            recent_rows = [r for r in rows if r.timestamp_utc >= window_start]
-            if not recent_rows:
-                # Regenerate once if the file is stale for the active window.
-                self.generator.generate()
-                rows = self.loader.load()
-                recent_rows = [r for r in rows if r.timestamp_utc >= window_start]
-            
-            if recent_rows:
-                # Convert traffic rows to serializable format
-                traffic_data = [
-                    {
-                        "timestamp_utc": r.timestamp_utc.isoformat(),
-                        "movement_type": r.movement_type,
-                        "runway": r.runway,
-                        "occupancy_seconds": r.occupancy_seconds
-                    }
-                    for r in recent_rows
-                ]
-                
-                # Generate task with real traffic data
-                task_data = {
-                    "traffic_movements": traffic_data,
-                    "window_start": window_start.isoformat(),
-                    "window_end": now.isoformat(),
-                    "airport_code": AIRPORT_CODE,
-                    "runway": RUNWAY
-                }
-                
-                for _ in range(TASKS_PER_CYCLE):
-                    self.task_manager.create_task("compute_congestion", WINDOW_MINUTES, task_data)
-            else:
-                logger.warning(" No traffic data in window; skipping task creation this cycle")
+        window_start_ns = _to_ns(now - timedelta(minutes=WINDOW_MINUTES))
+        if rows.ts[-1] < window_start_ns:
+            return self._regenerate()
+        return rows
+
+    def refresh_summary(self, rows: TrafficColumns, now: datetime) -> None:
+        self._ingest(rows)
+        self.store.set(self.calculator.compute(self.window, now))
+
+    def _run_cycle(self) -> None:
+        self.task_manager.log_activity()
+        rows = self._ensure_recent_data()
+        now = datetime.now(timezone.utc)
+        self.refresh_summary(rows, now)
+        
+        # Prepare traffic data for analysis task
+        window_start = now - timedelta(minutes=WINDOW_MINUTES)
+        window_start_ns = _to_ns(window_start)
+        recent_rows = rows.since(window_start_ns)
+        if not len(recent_rows):
+            # Regenerate once if the file is stale for the active window.
+            rows = self._regenerate()
+            self._ingest(rows)
+            recent_rows = rows.since(window_start_ns)
+        
+        if len(recent_rows):
+            # Convert traffic rows to serializable format
+            traffic_data = recent_rows.to_movements()
             
-            # Check for timeouts
-            self.task_manager.check_timeouts()
+            # Generate task with real traffic data
+            task_data = {
+                "traffic_movements": traffic_data,
+                "window_start": window_start.isoformat(),
+                "window_end": now.isoformat(),
+                "airport_code": AIRPORT_CODE,
+                "runway": RUNWAY
+            }
             
-            time.sleep(CYCLE_SECONDS)
-
-    def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+            self.task_manager.create_tasks(
+                "compute_congestion", WINDOW_MINUTES, task_data, TASKS_PER_CYCLE, created_at=now
+            )
+        else:
+            logger.warning(" No traffic data in window; skipping task creation this cycle")
+        # Taken after any regeneration, so the cycle's own rewrite doesn't count as new data.
+        self._cycle_data_key = self.loader.file_key()
+
+    async def run(self) -> None:
+        """Run cycles on the event loop's clock until cancelled"""
+        # Fixed cadence measured from a deadline, so cycle work does not
+        # stretch the period; cancellation wakes the sleep immediately.
+        loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        deadline = loop.time()
+        while True:
+            started = loop.time()
+            # CSV parsing and payload building stay off the event loop.
+            await asyncio.to_thread(self._run_cycle)
+            # Requests made while the cycle ran are served by it.
+            self._wake.clear()
+            # Skip missed ticks after an overrun instead of bursting to catch up.
+            deadline = max(deadline + CYCLE_SECONDS, loop.time())
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), deadline - loop.time())
+            if self._wake.is_set():
+                # Every request until the early cycle starts folds into it.
+                await asyncio.sleep(max(0.0, started + MIN_CYCLE_SECONDS - loop.time()))
+                deadline = loop.time()
+
+    def request_cycle(self) -> None:
+        """Run the next cycle early if the data file changed since the last one; call on the loop"""
+        if self._wake is None or self._wake.is_set():
             return
-        self._thread = threading.Thread(target=self._cycle, daemon=True)
-        self._thread.start()
+        # Without new data an early cycle would only repeat the last window's tasks.
+        if self.loader.file_key() != self._cycle_data_key:
+            self._wake.set()
 
-    def stop(self) -> None:
-        self._stop_event.set()
+    async def watch_timeouts(self) -> None:
+        """Sweep for dead nodes and stale tasks on a short cadence until cancelled"""
+        # Runs apart from the cycle so a slow cycle cannot delay timeout detection.
+        while True:
+            await asyncio.sleep(TIMEOUT_CHECK_SECONDS)
+            await asyncio.to_thread(self.task_manager.check_timeouts)
+
+
+# -----------------------------
+# Dashboard Rendering
+# -----------------------------
+def _h(value: Any) -> str:
+    """HTML-escaped display text; whole floats drop the trailing .0 like JS"""
+    if value is None:
+        return "-"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return html.escape(str(value))
+
+
+def _upper(value: Any) -> str:
+    return _h(value.upper() if isinstance(value, str) else value)
+
+
+def _stat(label: str, value: str, css: str = "") -> str:
+    css = f" {css}" if css else ""
+    return (
+        f'<div class="stat"><span class="stat-label">{label}</span>'
+        f'<span class="stat-value{css}">{value}</span></div>'
+    )
+
+
+def _card(title: str, body: str) -> str:
+    return f'<div class="card"><h2> {title}</h2>{body}</div>'
+
+
+def _placeholder(text: str) -> str:
+    return f'<div style="color: #94a3b8;">{text}</div>'
+
+
+def _render_latest_metrics(m: Optional[Dict[str, Any]]) -> str:
+    if not m:
+        return _placeholder("No completed phone results yet.")
+    peak_hour = m.get("peak_hour")
+    peak = str(peak_hour).zfill(2) if peak_hour is not None else "-"
+    return "".join((
+        _stat("Congestion", f"{_upper(m.get('congestion_level'))} ({_h(m.get('congestion_score'))}/10)"),
+        _stat(
+            "Movements",
+            f"{_h(m.get('total_movements'))} (A {_h(m.get('arrivals'))} / D {_h(m.get('departures'))})",
+        ),
+        _stat("Density", f"{_h(m.get('traffic_density'))} /hr"),
+        _stat("Occupancy", f"{_h(m.get('runway_occupancy_percent'))}%"),
+        _stat(
+            "Spacing (avg / min)",
+            f"{_h(m.get('avg_spacing_minutes'))}m / {_h(m.get('min_spacing_minutes'))}m",
+        ),
+        _stat("Peak Hour", f"{_h(peak)}:00 ({_h(m.get('peak_hour_movements'))})"),
+        f'<div class="timestamp">Computed at: {_h(m.get("computed_at"))}</div>',
+    ))
+
+
+def _render_xai(xai: Optional[Dict[str, Any]]) -> str:
+    if not xai:
+        return _placeholder("XAI not available yet.")
+    signals = xai.get("signals") or {}
+    return "".join((
+        _stat("Level / Score", f"{_upper(xai.get('congestion_level'))} ({_h(xai.get('congestion_score'))}/10)"),
+        "".join(_stat("Reason", _h(reason)) for reason in xai.get("reasons", [])),
+        '<div class="timestamp" style="margin-top: 8px;">'
+        f"Signals: density {_h(signals.get('traffic_density_per_hr'))}/hr, "
+        f"occupancy {_h(signals.get('runway_occupancy_percent'))}%, "
+        f"min spacing {_h(signals.get('min_spacing_minutes'))}m</div>",
+    ))
+
+
+def _render_ml(ml: Optional[Dict[str, Any]]) -> str:
+    if not ml:
+        return _placeholder("ML findings not available yet.")
+    return "".join((
+        _stat(
+            "Method",
+            f"{_h(ml.get('method'))} ({_h(ml.get('samples'))} samples, {_h(ml.get('bin_minutes'))}m bins)",
+        ),
+        _stat("Predicted Congestion", _upper(ml.get("predicted_congestion_level"))),
+        _stat("Predicted Density", f"{_h(ml.get('predicted_traffic_density_per_hr'))} /hr"),
+        _stat("Predicted Occupancy", f"{_h(ml.get('predicted_runway_occupancy_percent'))}%"),
+        _stat("Trend (density/bin)", _h(ml.get("trend_density_per_bin"))),
+        _stat("Trend (occupancy/bin)", f"{_h(ml.get('trend_occupancy_percent_per_bin'))}%"),
+    ))
+
+
+def _render_forecast(forecast: Optional[Dict[str, Any]]) -> str:
+    if not forecast:
+        return _placeholder("Forecast not available yet.")
+    f = forecast
+    return "".join((
+        _stat("Method", f"{_h(f.get('method'))} (last {_h(f.get('window_points'))})"),
+        _stat(
+            "Congestion",
+            f"{_upper(f.get('predicted_congestion_level'))} ({_h(f.get('predicted_congestion_score'))})",
+        ),
+        _stat("Density", f"{_h(f.get('predicted_traffic_density_per_hr'))} /hr"),
+        _stat("Occupancy", f"{_h(f.get('predicted_runway_occupancy_percent'))}%"),
+        _stat(
+            "Arrivals / Departures",
+            f"{_h(f.get('predicted_arrivals'))} / {_h(f.get('predicted_departures'))}",
+        ),
+    ))
+
+
+def _render_node(node: Dict[str, Any], timeout_seconds: float, grace_seconds: float) -> str:
+    if node["seconds_since_heartbeat"] > timeout_seconds:
+        status = "dead"
+    elif node["current_task"] or node["seconds_since_activity"] <= grace_seconds:
+        status = "working"
+    else:
+        status = "idle"
+    current = (
+        f'<span style="color: #3b82f6;"> {_h(node["current_task"])}</span>' if node["current_task"] else ""
+    )
+    return (
+        '<div class="node-item"><div>'
+        f'<strong>{_h(node["node_id"])}</strong>'
+        f'<span class="status-{status}">  {status.upper()}</span></div>'
+        f'<div class="timestamp">Last heartbeat: <span data-at="{_h(node["last_heartbeat"])}">'
+        f'{round(node["seconds_since_heartbeat"])}s ago</span>'
+        f' | Last activity: <span data-at="{_h(node["last_active_at"])}">'
+        f'{round(node["seconds_since_activity"])}s ago</span></div>'
+        '<div style="margin-top: 8px;"><span style="color: #64748b;">Tasks:</span>'
+        f'<span style="color: #10b981;">{_h(node["tasks_completed"])}</span>'
+        f'<span style="color: #ef4444;">{_h(node["tasks_failed"])}</span>{current}</div>'
+        "</div>"
+    )
+
+
+def _render_task(task: Dict[str, Any]) -> str:
+    line = '<div style="margin-top: 5px; color: #94a3b8;">'
+    duration = task.get("duration_seconds")
+    parts = [
+        '<div class="task-item"><div>',
+        f'<strong>{_h(task["task_id"])}</strong>',
+        f'<span class="status-{_h(task["status"])}"> {_upper(task["status"])}</span></div>',
+        f'{line}Type: {_h(task["type"])} | Window: {_h(task["window_minutes"])}m</div>',
+        f'{line}Node: {_h(task["node_id"] or "unassigned")}',
+        f" | Duration: {duration:.1f}s" if duration else "",
+        "</div>",
+    ]
+    data = task.get("task_data_summary")
+    if data and data.get("traffic_movements") is not None:
+        parts.append(
+            f'{line}Data: {_h(data["traffic_movements"])} movements | '
+            f'{_h(data.get("airport_code") or "N/A")} {_h(data.get("runway") or "")}</div>'
+        )
+    result = task.get("result_summary")
+    if result and result.get("congestion_level"):
+        parts.append(
+            f'{line}Result: {_upper(result["congestion_level"])} ({_h(result.get("congestion_score"))}/10), '
+            f'Density {_h(result.get("traffic_density"))}/hr, '
+            f'Occupancy {_h(result.get("runway_occupancy_percent"))}%</div>'
+        )
+    created = datetime.fromisoformat(task["created_at"]).astimezone().strftime("%H:%M:%S")
+    parts.append(f'<div class="timestamp">Created: {created}</div></div>')
+    return "".join(parts)
+
+
+def render_status_html(status: Dict[str, Any]) -> str:
+    """Dashboard #content fragment for a get_status() snapshot"""
+    nodes = status["nodes"]
+    tasks = status["tasks"]
+    latest_metrics = status.get("latest_metrics")
+    ml = latest_metrics.get("ml") if latest_metrics else None
+    timeout_seconds = status.get("node_timeout_seconds", 30)
+    grace_seconds = status.get("working_grace_seconds", 5)
+
+    overview = "".join((
+        _stat("Total Nodes", _h(nodes["total"])),
+        _stat("Alive Nodes", _h(nodes["alive"]), "status-alive"),
+        _stat("Working Nodes", _h(nodes["working"]), "status-working"),
+        _stat("Dead Nodes", _h(nodes["dead"]), "status-dead"),
+    ))
+    task_stats = "".join((
+        _stat("Total Tasks", _h(tasks["total"])),
+        _stat("Pending", _h(tasks["pending"]), "status-pending"),
+        _stat("Assigned", _h(tasks["assigned"]), "status-working"),
+        _stat("Completed", _h(tasks["completed"]), "status-completed"),
+        _stat("Failed", _h(tasks["failed"]), "status-failed"),
+        _stat("Queue Size", _h(tasks["queue_size"])),
+    ))
+    node_items = "".join(
+        _render_node(node, timeout_seconds, grace_seconds) for node in nodes["details"]
+    )
+    task_items = "".join(_render_task(task) for task in tasks["recent_tasks"][:10])
+    return "".join((
+        '<div class="grid">',
+        _card("System Overview", overview),
+        _card("Task Statistics", task_stats),
+        '</div><div class="grid">',
+        _card("Latest Phone Calculations", _render_latest_metrics(latest_metrics)),
+        _card("XAI: Why This Result", _render_xai(status.get("xai"))),
+        _card("ML Findings", _render_ml(ml)),
+        _card("Forecast: Next Window", _render_forecast(status.get("forecast"))),
+        '</div><div class="grid">',
+        _card("Active Nodes", node_items),
+        _card("Recent Tasks", task_items),
+        "</div>",
+    ))
 
 
 # -----------------------------
 # FastAPI App
 # -----------------------------
-app = FastAPI(title="VABB Primary Node - Distributed Task System")
 store = SummaryStore()
 task_manager = DistributedTaskManager()
 engine = CongestionEngine(DATA_FILE, store, task_manager)
 
 
-@app.on_event("startup")
-def on_startup() -> None:
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener.start()
     logger.info(" Server file: %s", __file__)
-    engine._ensure_recent_data()
-    now = datetime.now(timezone.utc)
-    rows = engine.loader.load()
-    summary = engine.calculator.compute(rows, WINDOW_MINUTES, now)
-    store.set(summary)
-    engine.start()
+    rows = await asyncio.to_thread(engine._ensure_recent_data)
+    engine.refresh_summary(rows, datetime.now(timezone.utc))
+    background = [
+        asyncio.create_task(engine.run()),
+        asyncio.create_task(engine.watch_timeouts()),
+    ]
     logger.info(" Server started - distributed task system online")
+    try:
+        yield
+    finally:
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        log_listener.stop()  # Flushes queued records
+
+
+class GzipRequestMiddleware:
+    """Inflate gzip-encoded request bodies (batched results from phones) before routing"""
+
+    def __init__(self, app, max_size: int = MAX_INFLATED_BODY_BYTES) -> None:
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not any(
+            name == b"content-encoding" and value.lower() == b"gzip"
+            for name, value in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
 
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
 
-@app.get("/")
-def root():
-    """Redirect to dashboard"""
-    return HTMLResponse("""
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = inflater.decompress(b"".join(chunks), self.max_size)
+        except zlib.error:
+            await Response("Invalid gzip body", status_code=400)(scope, receive, send)
+            return
+        if inflater.unconsumed_tail:
+            await Response("Request body too large", status_code=413)(scope, receive, send)
+            return
+
+        headers = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode("ascii")))
+        sent = False
+
+        async def inflated_receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(dict(scope, headers=headers), inflated_receive, send)
+
+
+app = FastAPI(title="VABB Primary Node - Distributed Task System", lifespan=lifespan)
+# Compresses /status and other JSON; skips event streams and pre-encoded bodies.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+app.add_middleware(GzipRequestMiddleware)
+
+
+# Static pages are encoded once at import; each request only wraps the bytes.
+ROOT_HTML = """
     <html>
         <head><meta http-equiv="refresh" content="0; url=/dashboard"></head>
         <body>Redirecting to dashboard...</body>
     </html>
-    """)
+    """.encode("utf-8")
 
-
-@app.get("/dashboard", response_class=HTMLResponse)
-def dashboard():
-    """Real-time monitoring dashboard"""
-    return HTMLResponse("""
+DASHBOARD_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -1017,335 +1880,219 @@ def dashboard():
         <div id="content">Loading...</div>
 
         <script>
-            async function fetchStatus() {
-                const response = await fetch('/status');
-                const data = await response.json();
-                renderStatus(data);
+            // Markup is rendered server-side; the page only swaps it in.
+            function render(fragment) {
+                document.getElementById('content').innerHTML = fragment;
+                updateAges();
             }
 
-            function renderStatus(data) {
-                const nodes = data.nodes;
-                const tasks = data.tasks;
-                const latestMetrics = data.latest_metrics;
-                const xai = data.xai;
-                const forecast = data.forecast;
-                const ml = latestMetrics ? latestMetrics.ml : null;
-                const serverFile = data.server_file;
-                const latestPresent = data.latest_result_present;
-                const timeoutSeconds = data.node_timeout_seconds ?? 30;
-                const graceSeconds = data.working_grace_seconds ?? 5;
-                
-                const html = `
-                    <div class="grid">
-                        <div class="card">
-                            <h2> System Overview</h2>
-                            <div class="stat">
-                                <span class="stat-label">Total Nodes</span>
-                                <span class="stat-value">${nodes.total}</span>
-                            </div>
-                            <div class="stat">
-                                <span class="stat-label">Alive Nodes</span>
-                                <span class="stat-value status-alive">${nodes.alive}</span>
-                            </div>
-                            <div class="stat">
-                                <span class="stat-label">Working Nodes</span>
-                                <span class="stat-value status-working">${nodes.working}</span>
-                            </div>
-                            <div class="stat">
-                                <span class="stat-label">Dead Nodes</span>
-                                <span class="stat-value status-dead">${nodes.dead}</span>
-                            </div>
-                        </div>
-
-                        <div class="card">
-                            <h2> Task Statistics</h2>
-                            <div class="stat">
-                                <span class="stat-label">Total Tasks</span>
-                                <span class="stat-value">${tasks.total}</span>
-                            </div>
-                            <div class="stat">
-                                <span class="stat-label">Pending</span>
-                                <span class="stat-value status-pending">${tasks.pending}</span>
-                            </div>
-                            <div class="stat">
-                                <span class="stat-label">Assigned</span>
-                                <span class="stat-value status-working">${tasks.assigned}</span>
-                            </div>
-                            <div class="stat">
-                                <span class="stat-label">Completed</span>
-                                <span class="stat-value status-completed">${tasks.completed}</span>
-                            </div>
-                            <div class="stat">
-                                <span class="stat-label">Failed</span>
-                                <span class="stat-value status-failed">${tasks.failed}</span>
-                            </div>
-                            <div class="stat">
-                                <span class="stat-label">Queue Size</span>
-                                <span class="stat-value">${tasks.queue_size}</span>
-                            </div>
-                        </div>
-                    </div>
-
-                    <div class="grid">
-                        <div class="card">
-                            <h2> Latest Phone Calculations</h2>
-                            ${latestMetrics ? `
-                                <div class="stat">
-                                    <span class="stat-label">Congestion</span>
-                                    <span class="stat-value">${latestMetrics.congestion_level?.toUpperCase?.() || latestMetrics.congestion_level} (${latestMetrics.congestion_score}/10)</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Movements</span>
-                                    <span class="stat-value">${latestMetrics.total_movements} (A ${latestMetrics.arrivals} / D ${latestMetrics.departures})</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Density</span>
-                                    <span class="stat-value">${latestMetrics.traffic_density} /hr</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Occupancy</span>
-                                    <span class="stat-value">${latestMetrics.runway_occupancy_percent}%</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Spacing (avg / min)</span>
-                                    <span class="stat-value">${latestMetrics.avg_spacing_minutes}m / ${latestMetrics.min_spacing_minutes}m</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Peak Hour</span>
-                                    <span class="stat-value">${String(latestMetrics.peak_hour).padStart(2,'0')}:00 (${latestMetrics.peak_hour_movements})</span>
-                                </div>
-                                <div class="timestamp">
-                                    Computed at: ${latestMetrics.computed_at}
-                                </div>
-                            ` : `
-                                <div style="color: #94a3b8;">No completed phone results yet.</div>
-                            `}
-                        </div>
-                        <div class="card">
-                            <h2> XAI: Why This Result</h2>
-                            ${xai ? `
-                                <div class="stat">
-                                    <span class="stat-label">Level / Score</span>
-                                    <span class="stat-value">${xai.congestion_level?.toUpperCase?.() || xai.congestion_level} (${xai.congestion_score}/10)</span>
-                                </div>
-                                ${xai.reasons.map(r => `
-                                    <div class="stat">
-                                        <span class="stat-label">Reason</span>
-                                        <span class="stat-value">${r}</span>
-                                    </div>
-                                `).join('')}
-                                <div class="timestamp" style="margin-top: 8px;">
-                                    Signals: density ${xai.signals.traffic_density_per_hr}/hr, occupancy ${xai.signals.runway_occupancy_percent}%, min spacing ${xai.signals.min_spacing_minutes}m
-                                </div>
-                            ` : `
-                                <div style="color: #94a3b8;">XAI not available yet.</div>
-                            `}
-                        </div>
-                        <div class="card">
-                            <h2> ML Findings</h2>
-                            ${ml ? `
-                                <div class="stat">
-                                    <span class="stat-label">Method</span>
-                                    <span class="stat-value">${ml.method} (${ml.samples} samples, ${ml.bin_minutes}m bins)</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Predicted Congestion</span>
-                                    <span class="stat-value">${ml.predicted_congestion_level?.toUpperCase?.() || ml.predicted_congestion_level}</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Predicted Density</span>
-                                    <span class="stat-value">${ml.predicted_traffic_density_per_hr} /hr</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Predicted Occupancy</span>
-                                    <span class="stat-value">${ml.predicted_runway_occupancy_percent}%</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Trend (density/bin)</span>
-                                    <span class="stat-value">${ml.trend_density_per_bin}</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Trend (occupancy/bin)</span>
-                                    <span class="stat-value">${ml.trend_occupancy_percent_per_bin}%</span>
-                                </div>
-                            ` : `
-                                <div style="color: #94a3b8;">ML findings not available yet.</div>
-                            `}
-                        </div>
-                        <div class="card">
-                            <h2> Forecast: Next Window</h2>
-                            ${forecast ? `
-                                <div class="stat">
-                                    <span class="stat-label">Method</span>
-                                    <span class="stat-value">${forecast.method} (last ${forecast.window_points})</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Congestion</span>
-                                    <span class="stat-value">${forecast.predicted_congestion_level?.toUpperCase?.() || forecast.predicted_congestion_level} (${forecast.predicted_congestion_score})</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Density</span>
-                                    <span class="stat-value">${forecast.predicted_traffic_density_per_hr} /hr</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Occupancy</span>
-                                    <span class="stat-value">${forecast.predicted_runway_occupancy_percent}%</span>
-                                </div>
-                                <div class="stat">
-                                    <span class="stat-label">Arrivals / Departures</span>
-                                    <span class="stat-value">${forecast.predicted_arrivals} / ${forecast.predicted_departures}</span>
-                                </div>
-                            ` : `
-                                <div style="color: #94a3b8;">Forecast not available yet.</div>
-                            `}
-                        </div>
-                    </div>
-
-                    <div class="grid">
-                        <div class="card">
-                            <h2> Active Nodes</h2>
-                            ${nodes.details.map(node => {
-                                const derivedStatus = (node.seconds_since_heartbeat > timeoutSeconds)
-                                    ? 'dead'
-                                    : (node.current_task || (node.seconds_since_activity <= graceSeconds))
-                                        ? 'working'
-                                        : 'idle';
-                                return `
-                                <div class="node-item">
-                                    <div>
-                                        <strong>${node.node_id}</strong>
-                                        <span class="status-${derivedStatus}">  ${derivedStatus.toUpperCase()}</span>
-                                    </div>
-                                    <div class="timestamp">
-                                        Last heartbeat: ${Math.round(node.seconds_since_heartbeat)}s ago | Last activity: ${Math.round(node.seconds_since_activity)}s ago
-                                    </div>
-                                    <div style="margin-top: 8px;">
-                                        <span style="color: #64748b;">Tasks:</span>
-                                        <span style="color: #10b981;">${node.tasks_completed}</span>
-                                        <span style="color: #ef4444;">${node.tasks_failed}</span>
-                                        ${node.current_task ? `<span style="color: #3b82f6;"> ${node.current_task}</span>` : ''}
-                                    </div>
-                                </div>
-                            `}).join('')}
-                        </div>
-
-                        <div class="card">
-                            <h2> Recent Tasks</h2>
-                            ${tasks.recent_tasks.slice(0, 10).map(task => `
-                                <div class="task-item">
-                                    <div>
-                                        <strong>${task.task_id}</strong>
-                                        <span class="status-${task.status}"> ${task.status.toUpperCase()}</span>
-                                    </div>
-                                    <div style="margin-top: 5px; color: #94a3b8;">
-                                        Type: ${task.type} | Window: ${task.window_minutes}m
-                                    </div>
-                                    <div style="margin-top: 5px; color: #94a3b8;">
-                                        Node: ${task.node_id || 'unassigned'}
-                                        ${task.duration_seconds ? ` | Duration: ${task.duration_seconds.toFixed(1)}s` : ''}
-                                    </div>
-                                    ${task.task_data_summary && task.task_data_summary.traffic_movements !== null ? `
-                                        <div style="margin-top: 5px; color: #94a3b8;">
-                                            Data: ${task.task_data_summary.traffic_movements} movements | ${task.task_data_summary.airport_code || 'N/A'} ${task.task_data_summary.runway || ''}
-                                        </div>
-                                    ` : ''}
-                                    ${task.result_summary && task.result_summary.congestion_level ? `
-                                        <div style="margin-top: 5px; color: #94a3b8;">
-                                            Result: ${task.result_summary.congestion_level.toUpperCase()} (${task.result_summary.congestion_score}/10), Density ${task.result_summary.traffic_density}/hr, Occupancy ${task.result_summary.runway_occupancy_percent}%
-                                        </div>
-                                    ` : ''}
-                                    <div class="timestamp">
-                                        Created: ${new Date(task.created_at).toLocaleTimeString()}
-                                    </div>
-                                </div>
-                            `).join('')}
-                        </div>
-                    </div>
-                `;
-                
-                document.getElementById('content').innerHTML = html;
+            // Ages tick here, so an unchanged (304) fragment stays current
+            function updateAges() {
+                const now = Date.now();
+                for (const el of document.querySelectorAll('[data-at]')) {
+                    const seconds = Math.max(0, Math.round((now - Date.parse(el.dataset.at)) / 1000));
+                    el.textContent = seconds + 's ago';
+                }
             }
+            setInterval(updateAges, 1000);
 
-            // Initial fetch
-            fetchStatus();
-            
-            // Auto-refresh every 2 seconds
-            setInterval(fetchStatus, 2000);
+            async function fetchStatus() {
+                const response = await fetch('/status/html');
+                render(await response.text());
+            }
+
+            // Live updates pushed by the server; poll where EventSource is missing
+            if (window.EventSource) {
+                const stream = new EventSource('/status/stream?format=html');
+                stream.onmessage = (event) => render(event.data);
+            } else {
+                fetchStatus();
+                setInterval(fetchStatus, 2000);
+            }
         </script>
     </body>
     </html>
-    """)
+    """.encode("utf-8")
+DASHBOARD_HTML_GZIP = gzip.compress(DASHBOARD_HTML)
+DASHBOARD_HEADERS = {"Cache-Control": "public, max-age=60", "Vary": "Accept-Encoding"}
+DASHBOARD_GZIP_HEADERS = {**DASHBOARD_HEADERS, "Content-Encoding": "gzip"}
+OK_JSON = b'{"status":"ok"}'  # Constant acknowledgement, encoded once
+
+
+@app.get("/")
+async def root():
+    """Redirect to dashboard"""
+    return HTMLResponse(ROOT_HTML)
+
+
+@app.get("/dashboard", response_class=HTMLResponse)
+async def dashboard(request: Request):
+    """Real-time monitoring dashboard"""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return HTMLResponse(DASHBOARD_HTML_GZIP, headers=DASHBOARD_GZIP_HEADERS)
+    return HTMLResponse(DASHBOARD_HTML, headers=DASHBOARD_HEADERS)
+
+
+def _conditional_response(request: Request, etag: str, body: Any, media_type: str) -> Response:
+    """304 when the client already holds this version, else the body"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
 
 
 @app.get("/status")
-def get_status() -> Dict[str, Any]:
+async def get_status(request: Request) -> Response:
     """Get detailed system status"""
-    return task_manager.get_status()
+    # Building the status is the heaviest request; keep it off the event loop.
+    etag, body = await asyncio.to_thread(task_manager.get_status_json_tagged)
+    return _conditional_response(request, etag, body, "application/json")
+
+
+@app.get("/status/html", response_class=HTMLResponse)
+async def get_status_html(request: Request) -> Response:
+    """Dashboard content fragment rendered from the current status"""
+    etag, fragment = await asyncio.to_thread(task_manager.get_status_html_tagged)
+    return _conditional_response(request, etag, fragment, "text/html")
+
+
+@app.get("/status/stream")
+async def status_stream(format: Literal["json", "html"] = "json") -> StreamingResponse:
+    """Stream status (or the dashboard fragment) as server-sent events on change"""
+    async def frames():
+        loop = asyncio.get_running_loop()
+        sent_version: Optional[int] = None
+        sent_at = 0.0
+        while True:
+            # Polling the version is cheap; concurrent viewers share one
+            # status build through the manager's short-lived cache.
+            version = task_manager.version
+            if version != sent_version or loop.time() - sent_at >= STATUS_STREAM_REFRESH_SECONDS:
+                if format == "html":
+                    fragment = await asyncio.to_thread(task_manager.get_status_html)
+                    # One data: line per fragment line; EventSource rejoins them.
+                    body = "\ndata: ".join(fragment.splitlines()).encode("utf-8")
+                else:
+                    body = await asyncio.to_thread(task_manager.get_status_json)
+                yield b"data: " + body + b"\n\n"
+                sent_version, sent_at = version, loop.time()
+            await asyncio.sleep(STATUS_STREAM_POLL_SECONDS)
+
+    return StreamingResponse(
+        frames(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
 
 
 @app.get("/summary")
-def get_summary() -> Dict[str, Any]:
+async def get_summary() -> Response:
     """Get congestion summary"""
-    summary = store.get()
-    if summary is None:
+    body = store.get_json()
+    if body is None:
         raise HTTPException(status_code=503, detail="Summary not ready")
-    return summary
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/node/heartbeat")
-def node_heartbeat(payload: dict):
+async def node_heartbeat(payload: dict) -> Dict[str, Any]:
     """Register node heartbeat"""
     node_id = payload.get("node")
     if not node_id:
         raise HTTPException(status_code=400, detail="Missing node ID")
     
     task_manager.register_node(node_id)
-    return JSONResponse({"status": "ok", "timestamp": time.time()})
+    return {"status": "ok", "timestamp": time.time()}
+
+
+@app.post("/node/ping", status_code=204)
+async def node_ping(node_id: str = Query(...)) -> Response:
+    """Register node heartbeat without a body; the cheap form of /node/heartbeat"""
+    task_manager.register_node(node_id)
+    return Response(status_code=204)
 
 
 @app.get("/task")
-def get_task(node_id: str = Query(...)) -> Optional[Dict[str, Any]]:
-    """Get next task for a node"""
+async def get_task(
+    request: Request,
+    node_id: str = Query(...),
+    wait: float = Query(0, ge=0, le=MAX_TASK_WAIT_SECONDS),
+) -> Response:
+    """Get next task for a node, holding the request up to wait seconds for one"""
     task_manager.register_node(node_id)  # Also counts as heartbeat
-    task = task_manager.get_next_task(node_id)
-    return task
+    body = task_manager.get_next_task(node_id)
+    if body is None:
+        engine.request_cycle()  # A node is starved; new data needn't wait a full cycle
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        seen = loop.time()
+        while body is None and loop.time() < deadline:
+            await asyncio.sleep(min(TASK_WAIT_POLL_SECONDS, deadline - loop.time()))
+            # Don't assign a task to a node that has stopped listening.
+            if await request.is_disconnected():
+                break
+            # The open poll stands in for the node's heartbeats while it is held
+            if loop.time() - seen >= HELD_POLL_HEARTBEAT_SECONDS:
+                task_manager.register_node(node_id)
+                seen = loop.time()
+            body = task_manager.get_next_task(node_id)
+    if body is None:
+        return Response(status_code=204)  # No task within the wait
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/payload/{sha}")
+async def get_payload(sha: str) -> Response:
+    """Serve a task's data by content hash"""
+    body = task_manager.get_payload(sha)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Unknown payload")
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
 
 
-@app.post("/task-result")
-def task_result(result: Dict[str, Any]):
-    """Receive task result from node"""
-    task_id = result.get("task_id")
-    node_id = result.get("node_id")
-    logger.info(
-        " Task result received: task_id=%s node_id=%s status=%s keys=%s",
-        task_id,
-        node_id,
-        result.get("status"),
-        list(result.keys()),
+def _record_result(result: TaskResult) -> None:
+    task_manager.register_node(result.node_id)  # Also counts as heartbeat
+    logger.debug(
+        " Task result received: task_id=%s node_id=%s status=%s",
+        result.task_id,
+        result.node_id,
+        result.status,
     )
     
-    if not task_id or not node_id:
-        raise HTTPException(status_code=400, detail="Missing task_id or node_id")
-    
-    if result.get("status") == "completed":
-        task_manager.complete_task(task_id, node_id, result)
+    if result.status == "completed":
+        task_manager.complete_task(result.task_id, result.node_id, result.model_dump(exclude_unset=True))
     else:
-        error = result.get("error", "Unknown error")
-        task_manager.fail_task(task_id, node_id, error)
-    
-    return {"status": "ok"}
+        task_manager.fail_task(result.task_id, result.node_id, result.error or "Unknown error")
+
+
+@app.post("/task-result")
+async def task_result(result: TaskResult) -> Response:
+    """Receive task result from node"""
+    _record_result(result)
+    return Response(content=OK_JSON, media_type="application/json")
+
+
+@app.post("/task-results")
+async def task_results(batch: TaskResultBatch) -> Response:
+    """Receive several task results from a node in one request"""
+    for result in batch.results:
+        _record_result(result)
+    return Response(content=OK_JSON, media_type="application/json")
 
 
 @app.post("/edge-feedback")
-def edge_feedback(payload: EdgeFeedback) -> Dict[str, Any]:
+async def edge_feedback(payload: EdgeFeedback) -> Response:
     """Log decisions from edge node"""
-    logger.info(
-        "Edge decision received: decision=%s notes=%s timestamp=%s",
-        payload.decision,
-        payload.notes,
-        payload.timestamp_utc,
-    )
-    return {"status": "ok"}
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Edge decision received: decision=%s notes=%s timestamp=%s",
+            payload.decision,
+            payload.notes,
+            payload.timestamp_utc,
+        )
+    return Response(content=OK_JSON, media_type="application/json")
 
 
 # -----------------------------
@@ -7,18 +7,59 @@ Enhanced phone node with transparent task distribution
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import time
+import gzip
 import json
+import logging
+import queue
+import signal
+import sys
+import random
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Dict, Any, List, Deque, Tuple
 
 # Configuration
 SERVER_URL = "http://10.39.86.168:8000"  # Replace with your Mac's LAN IP
 NODE_ID = "phone-node-1"
 HEARTBEAT_INTERVAL = 5  # seconds
-TASK_POLL_INTERVAL = 3  # seconds
+HEARTBEAT_RESYNC = HEARTBEAT_INTERVAL * 4  # full heartbeat this often; body-less pings between
+TASK_POLL_INTERVAL = 3  # seconds; first idle pause when the server can't hold a poll open
+MAX_POLL_INTERVAL = 30  # idle pauses double up to this while polls keep coming back empty
+TASK_WAIT_SECONDS = 20  # long-poll: the server holds /task this long waiting for work
+RESULT_BATCH_SIZE = 5  # results sent together while a backlog is being drained
+RESULT_MAX_DELAY = 2.0  # seconds; a held result is sent by then even mid-backlog
+MAX_RESULT_SENDS_IN_FLIGHT = 2  # background result posts outstanding before the loop waits
 MAX_RETRIES = 3
+RETRY_BASE_SECONDS = 0.5  # first retry delay, doubled per attempt and jittered
+RETRY_MAX_SECONDS = 8.0
 TIMEOUT = 5
+LOG_LEVEL = "INFO"  # DEBUG, INFO, WARN, ERROR or CRITICAL; lower levels are dropped
+COMPRESS_MIN_BYTES = 1024  # JSON bodies larger than this are sent gzipped
+PAYLOAD_CACHE_SIZE = 4  # task payloads kept by URL; identical windows are fetched once
+
+# One keep-alive connection pool for heartbeats, polls and results
+session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+_LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40, "CRITICAL": 50}
+
+# log() only enqueues records; the listener thread does the console writes.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+log_listener = QueueListener(_log_queue, _log_handler)
+logger = logging.getLogger("phone-node")
+logger.addHandler(QueueHandler(_log_queue))
+logger.setLevel(_LOG_LEVELS[LOG_LEVEL])
+logger.propagate = False
 
 # Statistics tracking
 class NodeStats:
@@ -26,19 +67,22 @@ class NodeStats:
         self.tasks_fetched = 0
         self.tasks_completed = 0
         self.tasks_failed = 0
+        self.results_rejected = 0
         self.heartbeats_sent = 0
         self.heartbeat_failures = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.total_task_time = 0.0
     
     def print_stats(self):
-        uptime = time.time() - self.start_time
+        uptime = time.monotonic() - self.start_time
         print("\n" + "="*60)
         print(f" NODE STATISTICS ({NODE_ID})")
         print("="*60)
         print(f" Uptime: {uptime:.0f}s ({uptime/60:.1f} minutes)")
         print(f" Heartbeats: {self.heartbeats_sent} sent, {self.heartbeat_failures} failed")
         print(f" Tasks: {self.tasks_fetched} fetched, {self.tasks_completed} completed, {self.tasks_failed} failed")
+        if self.results_rejected:
+            print(f" Results rejected by server: {self.results_rejected}")
         if self.tasks_completed > 0:
             avg_time = self.total_task_time / self.tasks_completed
             print(f" Average task time: {avg_time:.2f}s")
@@ -49,21 +93,28 @@ stats = NodeStats()
 
 def log(emoji: str, message: str, level: str = "INFO"):
     """Formatted logging with timestamps"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    _ = level
-    print(f"[{timestamp}] {message}")
+    logger.log(_LOG_LEVELS.get(level, logging.INFO), message)
     
 
-def make_request(method: str, endpoint: str, **kwargs) -> Optional[requests.Response]:
+def make_request(method: str, endpoint: str, timeout: Any = TIMEOUT, **kwargs) -> Optional[requests.Response]:
     """Make HTTP request with retry logic"""
     url = f"{SERVER_URL}{endpoint}"
+    if "json" in kwargs:
+        # Encode compactly, once, rather than on every attempt
+        body = json.dumps(kwargs.pop("json"), separators=(",", ":")).encode("utf-8")
+        kwargs["headers"] = {"Content-Type": "application/json"}
+        if len(body) > COMPRESS_MIN_BYTES:
+            # Result batches are repetitive JSON; gzip shrinks them ~10x on the uplink
+            body = gzip.compress(body, compresslevel=6)
+            kwargs["headers"]["Content-Encoding"] = "gzip"
+        kwargs["data"] = body
     
     for attempt in range(MAX_RETRIES):
         try:
             if method == "GET":
-                response = requests.get(url, timeout=TIMEOUT, **kwargs)
+                response = session.get(url, timeout=timeout, **kwargs)
             elif method == "POST":
-                response = requests.post(url, timeout=TIMEOUT, **kwargs)
+                response = session.post(url, timeout=timeout, **kwargs)
             else:
                 raise ValueError(f"Unsupported method: {method}")
             
@@ -76,44 +127,65 @@ def make_request(method: str, endpoint: str, **kwargs) -> Optional[requests.Resp
             log("", f"Connection error (attempt {attempt + 1}/{MAX_RETRIES})", "WARN")
         except requests.exceptions.HTTPError as e:
             log("", f"HTTP error: {e.response.status_code}", "ERROR")
-            return None
+            return e.response  # Falsy like None, but callers can read the status
         except Exception as e:
             log("", f"Unexpected error: {str(e)}", "ERROR")
             return None
         
         if attempt < MAX_RETRIES - 1:
-            time.sleep(1)  # Wait before retry
+            # Exponential backoff with jitter, so nodes don't retry in lockstep
+            delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt)
+            time.sleep(delay * (0.5 + random.random()))
     
     return None
 
 
-def _linear_regression(xs, ys):
-    if not xs or not ys or len(xs) != len(ys):
+def _linear_regression(ys):
+    """Least-squares fit of ys against x = 0..n-1; returns (slope, intercept)"""
+    n = len(ys)
+    if n == 0:
         return 0.0, 0.0
-    n = len(xs)
-    x_mean = sum(xs) / n
     y_mean = sum(ys) / n
-    num = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
-    den = sum((x - x_mean) ** 2 for x in xs)
-    if den == 0:
+    if n == 1:
         return 0.0, y_mean
+    # Closed forms for x = 0..n-1: mean (n-1)/2, sum of squared deviations n(n^2-1)/12
+    x_mean = (n - 1) / 2
+    num = sum(i * y for i, y in enumerate(ys)) - n * x_mean * y_mean
+    den = n * (n * n - 1) / 12
     slope = num / den
     intercept = y_mean - slope * x_mean
     return slope, intercept
 
 
-def _compute_ml_forecast(traffic_movements, window_minutes, window_start_str=None, window_end_str=None):
+def _parse_timestamps(traffic_movements):
+    """Each movement's timestamp_utc as a datetime; None where unparseable"""
+    stamps = []
+    for m in traffic_movements:
+        try:
+            stamps.append(datetime.fromisoformat(m["timestamp_utc"]))
+        except Exception:
+            stamps.append(None)
+    return stamps
+
+
+def _compute_ml_forecast(traffic_movements, window_minutes, window_start_str=None, window_end_str=None,
+                         stamps=None):
     if not traffic_movements:
         return None
+
+    # Callers that already parsed the timestamps pass them in as stamps.
+    if stamps is None:
+        stamps = _parse_timestamps(traffic_movements)
     try:
+        parsed = [ts for ts in stamps if ts is not None]
         if window_start_str:
             window_start = datetime.fromisoformat(window_start_str)
         else:
-            window_start = min(datetime.fromisoformat(m["timestamp_utc"]) for m in traffic_movements)
+            window_start = min(parsed)
         if window_end_str:
             window_end = datetime.fromisoformat(window_end_str)
         else:
-            window_end = max(datetime.fromisoformat(m["timestamp_utc"]) for m in traffic_movements)
+            window_end = max(parsed)
     except Exception:
         return None
 
@@ -121,31 +193,30 @@ def _compute_ml_forecast(traffic_movements, window_minutes, window_start_str=Non
     bin_seconds = bin_minutes * 60
     total_seconds = max(0, (window_end - window_start).total_seconds())
     bins = int(total_seconds // bin_seconds) + 1
+    last_bin = bins - 1
     counts = [0] * bins
     occ_sums = [0.0] * bins
 
-    for m in traffic_movements:
+    for ts, m in zip(stamps, traffic_movements):
         try:
-            ts = datetime.fromisoformat(m["timestamp_utc"])
             idx = int((ts - window_start).total_seconds() // bin_seconds)
             if idx < 0:
                 continue
-            if idx >= bins:
-                idx = bins - 1
+            if idx > last_bin:
+                idx = last_bin
             counts[idx] += 1
             occ_sums[idx] += float(m.get("occupancy_seconds", 0))
         except Exception:
             continue
 
-    xs = list(range(bins))
     density_series = [c * (60.0 / bin_minutes) for c in counts]
     occupancy_series = [
         min(100.0, (occ / bin_seconds) * 100.0) if bin_seconds > 0 else 0.0
         for occ in occ_sums
     ]
 
-    slope_d, intercept_d = _linear_regression(xs, density_series)
-    slope_o, intercept_o = _linear_regression(xs, occupancy_series)
+    slope_d, intercept_d = _linear_regression(density_series)
+    slope_o, intercept_o = _linear_regression(occupancy_series)
     next_x = bins
     pred_density = max(0.0, slope_d * next_x + intercept_d)
     pred_occupancy = max(0.0, min(100.0, slope_o * next_x + intercept_o))
@@ -170,15 +241,26 @@ def _compute_ml_forecast(traffic_movements, window_minutes, window_start_str=Non
     }
 
 
+# When the last full heartbeat (rather than a ping) went out
+_last_full_heartbeat = float("-inf")
+
+
 def send_heartbeat() -> bool:
     """Send heartbeat to server"""
-    payload = {
-        "node": NODE_ID,
-        "status": "alive",
-        "timestamp": time.time()
-    }
-    
-    response = make_request("POST", "/node/heartbeat", json=payload)
+    global _last_full_heartbeat
+    now = time.monotonic()
+    if now - _last_full_heartbeat < HEARTBEAT_RESYNC:
+        # Only the timestamp would change, so skip the JSON body
+        response = make_request("POST", "/node/ping", params={"node_id": NODE_ID})
+    else:
+        payload = {
+            "node": NODE_ID,
+            "status": "alive",
+            "timestamp": time.time()
+        }
+        response = make_request("POST", "/node/heartbeat", json=payload)
+        if response:
+            _last_full_heartbeat = now
     
     if response:
         stats.heartbeats_sent += 1
@@ -190,41 +272,117 @@ def send_heartbeat() -> bool:
         return False
 
 
-def fetch_task() -> Optional[Dict[str, Any]]:
-    """Fetch next task from server"""
+# When a /task poll or result post last reached the server; both count as heartbeats
+_last_contact = float("-inf")
+# Set while a long-poll is held open; the server refreshes our heartbeat meanwhile
+_poll_open = threading.Event()
+# Whether the last /task poll was held by the server for its whole wait and came back empty
+_last_poll_held = False
+
+
+def heartbeat_loop(stop: threading.Event) -> None:
+    """Send heartbeats every HEARTBEAT_INTERVAL until stop is set"""
+    # Runs on its own thread so long tasks or slow polls never delay a heartbeat.
+    while not stop.wait(HEARTBEAT_INTERVAL):
+        if _poll_open.is_set() or time.monotonic() - _last_contact < HEARTBEAT_INTERVAL:
+            continue  # Other traffic already told the server we're alive
+        try:
+            send_heartbeat()
+        except Exception as e:
+            log("", f"Heartbeat error: {str(e)}", "ERROR")
+
+
+_payload_cache: Dict[str, Any] = {}
+
+
+def fetch_payload(payload_url: str) -> Optional[Dict[str, Any]]:
+    """Fetch a content-addressed task payload, reusing cached copies"""
+    if payload_url in _payload_cache:
+        return _payload_cache[payload_url]
+    
+    response = make_request("GET", payload_url)
+    if not response:
+        return None
+    
+    try:
+        payload = json.loads(response.content)
+    except json.JSONDecodeError:
+        log("", "Invalid JSON payload", "ERROR")
+        return None
+    
+    if len(_payload_cache) >= PAYLOAD_CACHE_SIZE:
+        _payload_cache.pop(next(iter(_payload_cache)))
+    _payload_cache[payload_url] = payload
+    return payload
+
+
+def fetch_task(wait: float = 0) -> Optional[Dict[str, Any]]:
+    """Fetch next task from server, letting it hold the request up to wait seconds"""
+    global _last_contact, _last_poll_held
     log("", "Polling for new task...")
+    _last_poll_held = False
     
-    response = make_request("GET", "/task", params={"node_id": NODE_ID})
+    sent_at = time.monotonic()
+    params = {"node_id": NODE_ID}
+    if wait:
+        params["wait"] = wait
+    # Fail fast on connect; only the read may take as long as the server holds the poll
+    if wait:
+        _poll_open.set()
+    try:
+        response = make_request("GET", "/task", timeout=(TIMEOUT, TIMEOUT + wait), params=params)
+    finally:
+        _poll_open.clear()
     
     if not response:
         log("", "Failed to fetch task", "ERROR")
         return None
+    _last_contact = sent_at  # The server registers the poll when it arrives
     
     try:
-        task = response.json()
+        # 204 means the queue stayed empty for the whole wait
+        task = json.loads(response.content) if response.status_code != 204 else None
         if task:
             stats.tasks_fetched += 1
-            log("", f"Received task: {task.get('task_id')} (type: {task.get('type')})", "INFO")
+            task_id = task.get('task_id')
+            log("", f"Received task: {task_id} (type: {task.get('type')})", "INFO")
             log("  ", f" Assigned at: {task.get('assigned_at')}")
+            if "payload_url" in task and "data" not in task:
+                data = fetch_payload(task["payload_url"])
+                if data is None:
+                    # Leave the task assigned; the server re-queues it on timeout.
+                    log("", f"Failed to fetch payload for {task_id}", "ERROR")
+                    return None
+                task["data"] = data
             return task
         else:
             log("", "No tasks available in queue", "DEBUG")
+            _last_poll_held = bool(wait) and response.status_code == 204
             return None
     except json.JSONDecodeError:
         log("", "Invalid JSON response", "ERROR")
         return None
 
 
+def _rejected(response: Optional[requests.Response]) -> bool:
+    """True when the server refused a request in a way resending won't fix"""
+    return (response is not None and 400 <= response.status_code < 500
+            and response.status_code not in (408, 429))
+
+
 def send_task_result(result: Dict[str, Any]) -> bool:
-    """Send task result to server"""
+    """Send task result to server; False means it should be sent again later"""
+    global _last_contact
     task_id = result.get('task_id')
     status = result.get('status')
     
     log("", f"Sending result for {task_id} (status: {status})")
     
+    sent_at = time.monotonic()
     response = make_request("POST", "/task-result", json=result)
     
     if response:
+        _last_contact = sent_at
         try:
             log("", f"Server response: {response.status_code} {response.text.strip()}", "DEBUG")
         except Exception:
@@ -236,11 +394,59 @@ def send_task_result(result: Dict[str, Any]) -> bool:
             stats.tasks_failed += 1
             log("", f"Task {task_id} marked as failed", "WARN")
         return True
+    elif _rejected(response):
+        stats.results_rejected += 1
+        log("", f"Server rejected result for {task_id} ({response.status_code}); dropping it", "ERROR")
+        return True
     else:
         log("", f"Failed to send result for {task_id}", "ERROR")
         return False
 
 
+def send_task_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Send several task results in one request; returns those to send again later"""
+    global _last_contact
+    if len(results) == 1:
+        return [] if send_task_result(results[0]) else results
+    
+    log("", f"Sending {len(results)} results")
+    
+    sent_at = time.monotonic()
+    response = make_request("POST", "/task-results", json={"results": results})
+    
+    if _rejected(response):
+        # The batch is validated as a whole; send one at a time so only bad results are lost
+        log("", f"Server rejected batch of {len(results)} ({response.status_code}); sending singly", "WARN")
+        return [result for result in results if not send_task_result(result)]
+    if not response:
+        log("", f"Failed to send {len(results)} results", "ERROR")
+        return results
+    _last_contact = sent_at
+    for result in results:
+        if result.get('status') == "completed":
+            stats.tasks_completed += 1
+        else:
+            stats.tasks_failed += 1
+    log("", f"Results sent for {', '.join(str(r.get('task_id')) for r in results)}", "INFO")
+    return []
+
+
+def _reap_result_sends(in_flight: Deque[Tuple[Future, List[Dict[str, Any]]]],
+                       pending_results: List[Dict[str, Any]], limit: int) -> None:
+    """Collect finished result sends, waiting while more than limit are outstanding"""
+    # Sends run one at a time in submission order, so only the oldest can be done first.
+    while in_flight and (len(in_flight) > limit or in_flight[0][0].done()):
+        future, batch = in_flight.popleft()
+        try:
+            unsent = future.result()
+        except Exception as e:
+            log("", f"Result send error: {str(e)}", "ERROR")
+            unsent = batch
+        if unsent:
+            log("", f"Keeping {len(unsent)} results to retry", "ERROR")
+            pending_results[:0] = unsent
+
+
 def process_task(task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Process task and return result - NOW WITH REAL CALCULATIONS!"""
     if not task:
@@ -250,12 +456,12 @@ def process_task(task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     task_type = task.get('type')
     
     log("", f"Processing task {task_id}...", "INFO")
-    start_time = time.time()
+    start_time = time.monotonic()
     
     try:
         if task_type == "compute_congestion":
             # Extract real traffic data from task
-            data = task.get('data', {})
+            data = task.get('data') or {}
             traffic_movements = data.get('traffic_movements', [])
             window_minutes = task.get('window_minutes', 60)
             
@@ -271,9 +477,25 @@ def process_task(task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                     "timestamp": time.time()
                 }
             
-            # REAL CALCULATION 1: Count movements by type
-            arrivals = sum(1 for m in traffic_movements if m['movement_type'] == 'arrival')
-            departures = sum(1 for m in traffic_movements if m['movement_type'] == 'departure')
+            # Parsed once here; spacing and the ML forecast both reuse them
+            stamps = _parse_timestamps(traffic_movements)
+            
+            # REAL CALCULATION 1: Count movements and occupancy by type in one pass
+            # (the same pass groups movements by hour for calculation 4)
+            arrivals = departures = 0
+            arrival_occupancy = departure_occupancy = total_occupancy_seconds = 0
+            hourly_counts = [0] * 24
+            for m in traffic_movements:
+                hourly_counts[int(m['timestamp_utc'][11:13])] += 1  # Hour from ISO format
+                occupancy = m['occupancy_seconds']
+                total_occupancy_seconds += occupancy
+                movement_type = m['movement_type']
+                if movement_type == 'arrival':
+                    arrivals += 1
+                    arrival_occupancy += occupancy
+                elif movement_type == 'departure':
+                    departures += 1
+                    departure_occupancy += occupancy
             total_movements = arrivals + departures
             
             log("  ", f" Found {arrivals} arrivals, {departures} departures")
@@ -287,41 +509,26 @@ def process_task(task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             log("  ", f" Traffic density: {traffic_density:.1f} movements/hour")
             
             # REAL CALCULATION 3: Runway occupancy percentage
-            total_occupancy_seconds = sum(m['occupancy_seconds'] for m in traffic_movements)
             window_seconds = window_minutes * 60.0
             runway_occupancy = total_occupancy_seconds / window_seconds if window_seconds > 0 else 0.0
             runway_occupancy = min(1.0, runway_occupancy)  # Cap at 100%
             
             log("  ", f" Runway occupancy: {runway_occupancy*100:.1f}%")
             
-            # REAL CALCULATION 4: Peak hour detection
-            # Group movements by hour and find peak
-            from collections import defaultdict
-            hourly_counts = defaultdict(int)
-            for movement in traffic_movements:
-                # Parse timestamp and extract hour
-                ts_str = movement['timestamp_utc']
-                hour = int(ts_str[11:13])  # Extract hour from ISO format
-                hourly_counts[hour] += 1
-            
-            peak_hour = max(hourly_counts.items(), key=lambda x: x[1]) if hourly_counts else (0, 0)
+            # REAL CALCULATION 4: Peak hour detection (hours counted in calculation 1)
+            peak = max(range(24), key=hourly_counts.__getitem__)  # earliest hour wins ties
+            peak_hour = (peak, hourly_counts[peak])
             log("  ", f" Peak hour: {peak_hour[0]:02d}:00 with {peak_hour[1]} movements")
             
             # REAL CALCULATION 5: Average spacing between movements
-            if len(traffic_movements) > 1:
-                # Sort by timestamp
-                sorted_movements = sorted(traffic_movements, key=lambda x: x['timestamp_utc'])
-                
-                # Calculate time gaps in minutes
-                gaps = []
-                for i in range(len(sorted_movements) - 1):
-                    t1 = datetime.fromisoformat(sorted_movements[i]['timestamp_utc'])
-                    t2 = datetime.fromisoformat(sorted_movements[i+1]['timestamp_utc'])
-                    gap_minutes = (t2 - t1).total_seconds() / 60.0
-                    gaps.append(gap_minutes)
-                
-                avg_spacing = sum(gaps) / len(gaps) if gaps else 0.0
-                min_spacing = min(gaps) if gaps else 0.0
+            sorted_stamps = sorted(ts for ts in stamps if ts is not None)
+            if len(sorted_stamps) > 1:
+                # Gaps telescope, so their mean is the overall span over the gap count
+                span = sorted_stamps[-1] - sorted_stamps[0]
+                avg_spacing = span.total_seconds() / 60.0 / (len(sorted_stamps) - 1)
+                min_spacing = min(
+                    t2 - t1 for t1, t2 in zip(sorted_stamps, sorted_stamps[1:])
+                ).total_seconds() / 60.0
                 
                 log("  ", f" Avg spacing: {avg_spacing:.1f} min, Min: {min_spacing:.1f} min")
             else:
@@ -356,9 +563,6 @@ def process_task(task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 log("  ", f"  High imbalance: {arrival_percentage:.0f}% arrivals")
             
             # REAL CALCULATION 8: Occupancy rate by movement type
-            arrival_occupancy = sum(m['occupancy_seconds'] for m in traffic_movements if m['movement_type'] == 'arrival')
-            departure_occupancy = sum(m['occupancy_seconds'] for m in traffic_movements if m['movement_type'] == 'departure')
-            
             avg_arrival_time = arrival_occupancy / arrivals if arrivals > 0 else 0
             avg_departure_time = departure_occupancy / departures if departures > 0 else 0
             
@@ -370,6 +574,7 @@ def process_task(task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 window_minutes,
                 data.get("window_start"),
                 data.get("window_end"),
+                stamps=stamps,
             )
             if ml:
                 log(
@@ -445,7 +650,7 @@ def process_task(task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
                 "timestamp": time.time()
             }
         
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
         result["processing_time_seconds"] = round(processing_time, 3)
         stats.total_task_time += processing_time
         
@@ -453,10 +658,10 @@ def process_task(task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return result
         
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
         log("", f"Task {task_id} failed: {str(e)}", "ERROR")
-        import traceback
-        log("  ", f" {traceback.format_exc()}", "ERROR")
+        if logger.isEnabledFor(logging.DEBUG):  # Tracebacks only when debugging
+            log("  ", f" {traceback.format_exc()}", "DEBUG")
         return {
             "task_id": task_id,
             "node_id": NODE_ID,
@@ -472,52 +677,79 @@ def main_loop():
     log("", f"Starting node {NODE_ID}", "INFO")
     log("", f"Connecting to server: {SERVER_URL}", "INFO")
     
-    last_heartbeat = 0
     last_stats = 0
     stats_interval = 30  # Print stats every 30 seconds
+    pending_results: List[Dict[str, Any]] = []
+    pending_since = 0.0
+    # Results are posted on a worker thread so the upload overlaps the next fetch and task
+    sender = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results")
+    in_flight: Deque[Tuple[Future, List[Dict[str, Any]]]] = deque()
+    poll_interval = TASK_POLL_INTERVAL
     
-    # Initial heartbeat
+    # Initial heartbeat, then keep them going in the background
     send_heartbeat()
+    stop = threading.Event()
+    threading.Thread(target=heartbeat_loop, args=(stop,), name="heartbeat", daemon=True).start()
     
     while True:
         try:
-            current_time = time.time()
-            
-            # Send heartbeat periodically
-            if current_time - last_heartbeat >= HEARTBEAT_INTERVAL:
-                send_heartbeat()
-                last_heartbeat = current_time
+            current_time = time.monotonic()
             
             # Print stats periodically
             if current_time - last_stats >= stats_interval:
                 stats.print_stats()
                 last_stats = current_time
             
-            # Fetch and process task
-            task = fetch_task()
+            _reap_result_sends(in_flight, pending_results, MAX_RESULT_SENDS_IN_FLIGHT)
+            
+            # Fetch and process task; only long-poll when no results are waiting
+            task = fetch_task(wait=0 if pending_results else TASK_WAIT_SECONDS)
             
             if task:
-                log("", f"Starting work on {task.get('task_id')}", "INFO")
+                task_id = task.get('task_id')
+                log("", f"Starting work on {task_id}", "INFO")
                 
                 # Process task
                 result = process_task(task)
                 
                 if result:
-                    # Send result
-                    success = send_task_result(result)
-                    
-                    if success:
-                        log("", f"Task {task.get('task_id')} completed successfully!", "INFO")
-                    else:
-                        log("", f"Failed to report completion of {task.get('task_id')}", "ERROR")
+                    if not pending_results:
+                        pending_since = time.monotonic()
+                    pending_results.append(result)
                 else:
-                    log("", f"Task {task.get('task_id')} produced no result", "WARN")
+                    log("", f"Task {task_id} produced no result", "WARN")
+            
+            # Send results once the backlog is drained, a batch is full or the
+            # oldest one has waited long enough
+            if pending_results and (not task or len(pending_results) >= RESULT_BATCH_SIZE
+                                    or time.monotonic() - pending_since >= RESULT_MAX_DELAY):
+                in_flight.append((sender.submit(send_task_results, pending_results), pending_results))
+                pending_results = []
+                _reap_result_sends(in_flight, pending_results, MAX_RESULT_SENDS_IN_FLIGHT)
             
-            # Wait before next poll
-            time.sleep(TASK_POLL_INTERVAL)
+            # Pause unless a task came back or the server held the poll open;
+            # back off while failures or instant empty replies continue, to spare the radio
+            if task or _last_poll_held:
+                poll_interval = TASK_POLL_INTERVAL
+            else:
+                time.sleep(poll_interval)
+                poll_interval = min(MAX_POLL_INTERVAL, poll_interval * 2)
             
         except KeyboardInterrupt:
             log("", "Shutting down gracefully...", "INFO")
+            stop.set()
+            # Finish outstanding result posts and send whatever is still held
+            if pending_results:
+                in_flight.append((sender.submit(send_task_results, pending_results), pending_results))
+                pending_results = []
+            _reap_result_sends(in_flight, pending_results, 0)
+            sender.shutdown()
+            if pending_results:
+                # One last attempt; anything still unsent is lost with the process
+                unsent = send_task_results(pending_results)
+                if unsent:
+                    log("", f"Dropping {len(unsent)} unsent results on shutdown: "
+                        f"{', '.join(str(r.get('task_id')) for r in unsent)}", "ERROR")
             stats.print_stats()
             break
         except Exception as e:
@@ -538,8 +770,14 @@ if __name__ == "__main__":
     
     time.sleep(1)  # Pause for dramatic effect
     
+    # Treat SIGTERM (supervisor stop/restart) like Ctrl+C: the same graceful path
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    log_listener.start()
     try:
         main_loop()
     except Exception as e:
         log("", f"Fatal error: {str(e)}", "CRITICAL")
         stats.print_stats()
+    finally:
+        session.close()  # Closes pooled keep-alive sockets
+        log_listener.stop()  # Flushes queued records